@@ -9,6 +9,7 @@ pipelines), so runtime code does not query packaging metadata.
 Contents
 --------
 * Module-level constants describing the published package.
+* :func:`info_text` building the metadata banner once per process.
 * :func:`print_info` rendering the constants for the CLI ``info`` command.
 
 System Role
@@ -20,6 +21,7 @@ present authoritative project information without invoking packaging APIs.
 from __future__ import annotations
 
 import sys
+from functools import cache
 
 #: Distribution name declared in ``pyproject.toml``.
 name = "lib_log_rich"
@@ -44,24 +46,22 @@ LAYEREDCONF_APP: str = "Lib Log Rich"
 LAYEREDCONF_SLUG: str = "lib_log_rich"
 
 
-def print_info() -> None:
-    """Print the summarised metadata block used by the CLI ``info`` command.
+@cache
+def info_text() -> str:
+    """Return the summarised metadata block used by the CLI ``info`` command.
 
     Why
-        Provides a single, auditable rendering function so documentation and
-        CLI output always match the system design reference.
-
-    Side Effects
-        Writes to ``stdout``.
+        The banner only depends on the module constants above, so it is built
+        once and reused by :func:`print_info` and ``summary_info`` instead of
+        being re-rendered (and captured from ``stdout``) on every call.
 
     Examples
     --------
-    >>> print_info()  # doctest: +ELLIPSIS
-    Info for lib_log_rich:
-    ...
+    >>> info_text().splitlines()[0]
+    'Info for lib_log_rich:'
     """
 
-    fields = [
+    fields = (
         ("name", name),
         ("title", title),
         ("version", version),
@@ -69,8 +69,29 @@ def print_info() -> None:
         ("author", author),
         ("author_email", author_email),
         ("shell_command", shell_command),
-    ]
+    )
     pad = max(len(label) for label, _ in fields)
     lines = [f"Info for {name}:", ""]
     lines.extend(f"    {label.ljust(pad)} = {value}" for label, value in fields)
-    sys.stdout.write("\n".join(lines) + "\n")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def print_info() -> None:
+    """Print the summarised metadata block used by the CLI ``info`` command.
+
+    Why
+        Provides a single, auditable rendering function so documentation and
+        CLI output always match the system design reference.
+
+    Side Effects
+        Writes to ``stdout``.
+
+    Examples
+    --------
+    >>> print_info()  # doctest: +ELLIPSIS
+    Info for lib_log_rich:
+    ...
+    """
+
+    sys.stdout.write(info_text())
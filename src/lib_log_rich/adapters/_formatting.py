@@ -8,7 +8,10 @@ documentation remains authoritative.
 
 Contents
 --------
+* :data:`LEVEL_TEXT` - precomputed upper-case severity labels per level.
 * :func:`build_format_payload` - generate placeholder values for a log event.
+* :class:`FormatPayloadView` - lazy read-only mapping handed to template renderers.
+* :func:`compile_template` - pre-parse a ``str.format`` template once per pattern.
 
 System Role
 -----------
@@ -19,18 +22,22 @@ doctested examples all rely on the same data contract.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
 from typing import TYPE_CHECKING, Any
 
+from lib_log_rich.domain.levels import LogLevel
+
 if TYPE_CHECKING:
     from datetime import datetime
 
     from lib_log_rich.domain.context import LogContext
     from lib_log_rich.domain.events import LogEvent
-    from lib_log_rich.domain.levels import LogLevel
 
 ChainInput = Iterable[int | str] | int | str | None
+TemplateRenderer = Callable[[Mapping[str, Any]], str]
 
 # Context field names for iteration-based merging (reduces cyclomatic complexity)
 _CONTEXT_FIELDS: tuple[str, ...] = (
@@ -45,6 +52,13 @@ _CONTEXT_FIELDS: tuple[str, ...] = (
     "span_id",
 )
 
+#: Upper-case severity label per level (``{LEVEL}`` placeholder, dump tables).
+LEVEL_TEXT: dict[LogLevel, str] = {level: level.severity.upper() for level in LogLevel}
+
+#: ``(LEVEL, level_name, level_code, level_icon)`` per level, resolved once at
+#: import instead of walking enum properties and upper-casing on every event.
+_LEVEL_FIELDS: dict[LogLevel, tuple[str, str, str, str]] = {level: (LEVEL_TEXT[level], level.name, level.code, level.icon) for level in LogLevel}
+
 
 @dataclass(slots=True, frozen=True)
 class TimestampFields:
@@ -166,13 +180,145 @@ class FormatPayload:
             "pathname": self.pathname,
             "lineno": self.lineno,
             "funcName": self.funcName,
+            # Aliases for backwards compatibility
+            "level.icon": self.level_icon,
+            "level.severity": self.LEVEL,
         }
-        # Aliases for backwards compatibility
-        payload["level.icon"] = self.level_icon
-        payload["level.severity"] = self.LEVEL
         return payload
 
 
+#: Placeholders filled from :func:`_timestamp_variants` of the UTC/local stamp, in tuple order.
+_UTC_TIMESTAMP_FIELDS: tuple[str, ...] = ("timestamp", "timestamp_trimmed", "timestamp_trimmed_naive", "YYYY", "MM", "DD", "hh", "mm", "ss")
+_LOCAL_TIMESTAMP_FIELDS: tuple[str, ...] = tuple(
+    f"{name}_loc" for name in ("timestamp", "timestamp_trimmed", "timestamp_trimmed_naive", "YYYY", "MM", "DD", "hh", "mm", "ss")
+)
+
+
+def _timestamp_getter(name: str) -> Callable[[FormatPayloadView], str]:
+    """Return an accessor resolving one timestamp placeholder from a view."""
+    if name == "timestamp_no_us":
+        name = "timestamp_trimmed"
+    if name in _LOCAL_TIMESTAMP_FIELDS:
+        local_index = _LOCAL_TIMESTAMP_FIELDS.index(name)
+        return lambda view: view.local_timestamps[local_index]
+    index = _UTC_TIMESTAMP_FIELDS.index(name)
+    return lambda view: view.utc_timestamps[index]
+
+
+def _level_getter(index: int) -> Callable[[FormatPayloadView], str]:
+    """Return an accessor reading one column of :data:`_LEVEL_FIELDS`."""
+
+    def get(view: FormatPayloadView) -> str:
+        return _LEVEL_FIELDS[view.event.level][index]
+
+    return get
+
+
+def _extra_getter(name: str) -> Callable[[FormatPayloadView], Any]:
+    """Return an accessor reading ``extra[name]`` (``None`` when missing)."""
+
+    def get(view: FormatPayloadView) -> Any:
+        return view.event.extra.get(name)
+
+    return get
+
+
+#: Placeholder name -> accessor, mirroring the keys produced by ``FormatPayload.to_dict``.
+_PLACEHOLDER_GETTERS: dict[str, Callable[[FormatPayloadView], Any]] = {
+    **{name: _timestamp_getter(name) for name in TimestampFields.__slots__},
+    "level": _level_getter(0),
+    "level_enum": lambda view: view.event.level,
+    "LEVEL": _level_getter(0),
+    "level_name": _level_getter(1),
+    "level_code": _level_getter(2),
+    "level_icon": _level_getter(3),
+    "logger_name": lambda view: view.event.logger_name,
+    "event_id": lambda view: view.event.event_id,
+    "message": lambda view: view.event.message,
+    "context": lambda view: view.event.context.to_dict(include_none=True),
+    "extra": lambda view: view.event.extra,
+    "context_fields": lambda view: _merge_context_and_extra(view.event.context, view.event.extra),
+    "user_name": lambda view: view.event.context.user_name,
+    "hostname": lambda view: view.event.context.hostname,
+    "process_id": lambda view: view.event.context.process_id,
+    "process_id_chain": lambda view: _normalise_process_chain(view.event.context.process_id_chain),
+    "theme": _extra_getter("theme"),
+    "pathname": _extra_getter("pathname"),
+    "lineno": _extra_getter("lineno"),
+    "funcName": _extra_getter("funcName"),
+    "level.icon": _level_getter(3),
+    "level.severity": _level_getter(0),
+}
+
+
+class FormatPayloadView(Mapping[str, Any]):
+    """Lazy, read-only placeholder mapping for a single :class:`LogEvent`.
+
+    Keys match :meth:`FormatPayload.to_dict`, but values are computed only when
+    a template asks for them: ``{message}`` never builds timestamps, the
+    ``context`` dict, or ``context_fields``. UTC and local timestamp variants
+    are built as two groups on first use, so ``{hh}:{mm}`` never converts the
+    stamp to local time.
+
+    Example:
+        >>> from datetime import datetime, timezone
+        >>> from lib_log_rich.domain.context import LogContext
+        >>> from lib_log_rich.domain.events import LogEvent
+        >>> ctx = LogContext(service="svc", environment="prod", job_id="job")
+        >>> event = LogEvent("id", datetime(2025, 9, 30, 12, 0, tzinfo=timezone.utc), "svc", LogLevel.INFO, "msg", ctx)
+        >>> "{hh}:{mm} {LEVEL} {message}".format_map(FormatPayloadView(event))
+        '12:00 INFO msg'
+
+    """
+
+    __slots__ = ("_event", "_local", "_utc")
+
+    def __init__(self, event: LogEvent) -> None:
+        """Wrap ``event`` without computing any placeholder yet."""
+        self._event = event
+        self._utc: tuple[str, ...] | None = None
+        self._local: tuple[str, ...] | None = None
+
+    @property
+    def event(self) -> LogEvent:
+        """Return the wrapped event."""
+        return self._event
+
+    @property
+    def utc_timestamps(self) -> tuple[str, ...]:
+        """Return the event-time variants ordered like :data:`_UTC_TIMESTAMP_FIELDS`."""
+        variants = self._utc
+        if variants is None:
+            event = self._event
+            variants = self._utc = _timestamp_variants(event.timestamp, event.timestamp_iso)
+        return variants
+
+    @property
+    def local_timestamps(self) -> tuple[str, ...]:
+        """Return the local-time variants ordered like :data:`_LOCAL_TIMESTAMP_FIELDS`."""
+        variants = self._local
+        if variants is None:
+            local = self._event.timestamp.astimezone()
+            variants = self._local = _timestamp_variants(local, local.isoformat())
+        return variants
+
+    def __getitem__(self, key: str) -> Any:
+        """Resolve a single placeholder; unknown names raise ``KeyError``."""
+        try:
+            getter = _PLACEHOLDER_GETTERS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return getter(self)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over placeholder names in ``to_dict`` order."""
+        return iter(_PLACEHOLDER_GETTERS)
+
+    def __len__(self) -> int:
+        """Return the number of available placeholders."""
+        return len(_PLACEHOLDER_GETTERS)
+
+
 def _normalise_process_chain(values: ChainInput) -> str:
     """Return a human-readable representation of PID ancestry chains.
 
@@ -192,6 +338,9 @@ def _normalise_process_chain(values: ChainInput) -> str:
     """
     if not values:
         return ""
+    if isinstance(values, tuple):
+        # Fast path: LogContext always stores the chain as a tuple of ints.
+        return ">".join(map(str, values))
     if isinstance(values, Iterable) and not isinstance(values, (str, bytes)):
         return ">".join(str(item) for item in values)
     return str(values)
@@ -203,6 +352,29 @@ def _merge_context_and_extra(context: LogContext, extra: dict[str, Any]) -> str:
     Uses direct attribute access on LogContext dataclass instead of dict conversion.
     Keys are sorted for deterministic output across log events.
     """
+    if context.extra or extra:
+        return _merge_with_extras(context, extra)
+
+    # Fast path: only fixed context fields, so keys are unique and no field
+    # name is a prefix ending before "=" - sorting "key=value" strings orders
+    # them exactly like sorting the keys.
+    parts: list[str] = []
+    for field_name in _CONTEXT_FIELDS:
+        value = getattr(context, field_name)
+        if value:
+            parts.append(f"{field_name}={value}")
+    if context.process_id is not None:
+        parts.append(f"process_id={context.process_id}")
+    if context.process_id_chain:
+        parts.append(f"process_id_chain={context.process_id_chain}")
+    if not parts:
+        return ""
+    parts.sort()
+    return " " + " ".join(parts)
+
+
+def _merge_with_extras(context: LogContext, extra: dict[str, Any]) -> str:
+    """Build context_fields when context or event extras may override keys."""
     merged_pairs: dict[str, Any] = {}
 
     # Collect non-None context fields via iteration
@@ -219,8 +391,10 @@ def _merge_context_and_extra(context: LogContext, extra: dict[str, Any]) -> str:
     if context.extra:
         merged_pairs.update(context.extra)
 
-    # Add extra fields
-    merged_pairs.update({key: value for key, value in extra.items() if value not in (None, {})})
+    # Add extra fields (most events carry none, so skip the comprehension).
+    # ``is not None`` settles the common case before any ``{}`` is built.
+    if extra:
+        merged_pairs.update({key: value for key, value in extra.items() if value is not None and value != {}})
 
     if not merged_pairs:
         return ""
@@ -230,46 +404,130 @@ def _merge_context_and_extra(context: LogContext, extra: dict[str, Any]) -> str:
     return " " + " ".join(f"{key}={merged_pairs[key]}" for key in sorted_keys)
 
 
-def _format_process_chain_for_template(chain: tuple[int, ...]) -> ChainInput:
-    """Normalize process_id_chain tuple to a format suitable for _normalise_process_chain."""
-    if chain:
-        return tuple(str(part) for part in chain)
-    return None
+def _split_iso_date_parts(iso: str) -> tuple[str, str, str, str, str, str]:
+    """Slice ``YYYY``/``MM``/``DD``/``hh``/``mm``/``ss`` out of an ISO string.
+
+    ``datetime.isoformat`` always emits a zero-padded ``YYYY-MM-DDThh:mm:ss``
+    prefix, so slicing the string we already produced replaces six separate
+    format operations.
+
+    Example:
+        >>> _split_iso_date_parts("2025-10-13T14:15:16+00:00")
+        ('2025', '10', '13', '14', '15', '16')
+
+    """
+    return iso[0:4], iso[5:7], iso[8:10], iso[11:13], iso[14:16], iso[17:19]
+
+
+def _timestamp_variants(stamp: datetime, iso: str) -> tuple[str, ...]:
+    """Return ``(iso, trimmed, trimmed_naive, YYYY, MM, DD, hh, mm, ss)`` for ``stamp``.
+
+    ``iso`` is ``stamp.isoformat()``, supplied by the caller so the event
+    timestamp can reuse :attr:`LogEvent.timestamp_iso`.
 
+    ``isoformat`` places ``.ffffff`` at ``[19:26]`` only when microseconds are
+    set, so slicing one ISO string replaces a second ``replace().isoformat()``.
+    The naive variant is the trimmed string without its UTC offset.
 
-def _build_timestamp_fields(
-    *,
-    timestamp: datetime,
-    local_timestamp: datetime,
-    trimmed_timestamp: datetime,
-    trimmed_local: datetime,
-    trimmed_naive: datetime,
-    trimmed_local_naive: datetime,
-) -> TimestampFields:
-    """Build all timestamp-related fields for the payload."""
+    Example:
+        >>> from datetime import datetime, timezone
+        >>> stamp = datetime(2025, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+        >>> _timestamp_variants(stamp, stamp.isoformat())[:3]
+        ('2025-01-02T03:04:05.000006+00:00', '2025-01-02T03:04:05+00:00', '2025-01-02T03:04:05')
+
+    """
+    trimmed = iso[:19] + iso[26:] if stamp.microsecond else iso
+    return (iso, trimmed, trimmed[:19], *_split_iso_date_parts(trimmed))
+
+
+def _build_timestamp_fields(*, timestamp: datetime, iso: str, local_timestamp: datetime) -> TimestampFields:
+    """Build all timestamp-related fields for the payload; ``iso`` is ``timestamp.isoformat()``."""
+    iso, trimmed, trimmed_naive, year, month, day, hour, minute, second = _timestamp_variants(timestamp, iso)
+    (
+        iso_loc,
+        trimmed_loc,
+        trimmed_naive_loc,
+        year_loc,
+        month_loc,
+        day_loc,
+        hour_loc,
+        minute_loc,
+        second_loc,
+    ) = _timestamp_variants(local_timestamp, local_timestamp.isoformat())
     return TimestampFields(
-        timestamp=timestamp.isoformat(),
-        timestamp_trimmed=trimmed_timestamp.isoformat(),
-        timestamp_no_us=trimmed_timestamp.isoformat(),
-        timestamp_trimmed_naive=trimmed_naive.isoformat(),
-        timestamp_loc=local_timestamp.isoformat(),
-        timestamp_trimmed_loc=trimmed_local.isoformat(),
-        timestamp_trimmed_naive_loc=trimmed_local_naive.isoformat(),
-        YYYY=f"{timestamp.year:04d}",
-        MM=f"{timestamp.month:02d}",
-        DD=f"{timestamp.day:02d}",
-        hh=f"{timestamp.hour:02d}",
-        mm=f"{timestamp.minute:02d}",
-        ss=f"{timestamp.second:02d}",
-        YYYY_loc=f"{local_timestamp.year:04d}",
-        MM_loc=f"{local_timestamp.month:02d}",
-        DD_loc=f"{local_timestamp.day:02d}",
-        hh_loc=f"{local_timestamp.hour:02d}",
-        mm_loc=f"{local_timestamp.minute:02d}",
-        ss_loc=f"{local_timestamp.second:02d}",
+        timestamp=iso,
+        timestamp_trimmed=trimmed,
+        timestamp_no_us=trimmed,
+        timestamp_trimmed_naive=trimmed_naive,
+        timestamp_loc=iso_loc,
+        timestamp_trimmed_loc=trimmed_loc,
+        timestamp_trimmed_naive_loc=trimmed_naive_loc,
+        YYYY=year,
+        MM=month,
+        DD=day,
+        hh=hour,
+        mm=minute,
+        ss=second,
+        YYYY_loc=year_loc,
+        MM_loc=month_loc,
+        DD_loc=day_loc,
+        hh_loc=hour_loc,
+        mm_loc=minute_loc,
+        ss_loc=second_loc,
     )
 
 
+_CONVERSIONS: dict[str, Callable[[Any], str]] = {"s": str, "r": repr, "a": ascii}
+
+
+@lru_cache(maxsize=32)
+def compile_template(pattern: str) -> TemplateRenderer:
+    """Parse ``pattern`` once and return a renderer taking a placeholder mapping.
+
+    The renderer produces exactly what ``pattern.format_map(mapping)`` would,
+    but the template is tokenised a single time instead of on every event.
+    Templates using positional fields, attribute/index access, or nested
+    format specs fall back to ``pattern.format_map`` unchanged.
+
+    Args:
+        pattern: ``str.format`` template such as a console or dump preset.
+
+    Returns:
+        Callable rendering a mapping (for example a :class:`FormatPayloadView`).
+
+    Raises:
+        ValueError: If ``pattern`` is not a valid format string.
+
+    Example:
+        >>> render = compile_template("{LEVEL:<5}|{message!r}")
+        >>> render({"LEVEL": "INFO", "message": "hi"})
+        "INFO |'hi'"
+
+    """
+    pieces: list[tuple[str, str | None, Callable[[Any], str] | None, str]] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(pattern):
+        if field_name is None:
+            pieces.append((literal, None, None, ""))
+            continue
+        if not field_name.isidentifier() or (format_spec and "{" in format_spec) or (conversion and conversion not in _CONVERSIONS):
+            return pattern.format_map
+        pieces.append((literal, field_name, _CONVERSIONS[conversion] if conversion else None, format_spec or ""))
+
+    def render(mapping: Mapping[str, Any]) -> str:
+        parts: list[str] = []
+        append = parts.append
+        for literal, field_name, convert, format_spec in pieces:
+            append(literal)
+            if field_name is not None:
+                value = mapping[field_name]
+                if convert is not None:
+                    value = convert(value)
+                append(format(value, format_spec))
+        return "".join(parts)
+
+    return render
+
+
 def build_format_payload(event: LogEvent) -> FormatPayload:
     """Construct the FormatPayload consumed by console/text dump templates.
 
@@ -281,32 +539,21 @@ def build_format_payload(event: LogEvent) -> FormatPayload:
     context = event.context
     extra = event.extra
     context_fields = _merge_context_and_extra(context, extra)
-    formatted_chain = _format_process_chain_for_template(context.process_id_chain)
 
     timestamp = event.timestamp
-    trimmed_timestamp = timestamp.replace(microsecond=0)
-    local_timestamp = timestamp.astimezone()
-    trimmed_local = local_timestamp.replace(microsecond=0)
-
-    timestamp_fields = _build_timestamp_fields(
-        timestamp=timestamp,
-        local_timestamp=local_timestamp,
-        trimmed_timestamp=trimmed_timestamp,
-        trimmed_local=trimmed_local,
-        trimmed_naive=trimmed_timestamp.replace(tzinfo=None),
-        trimmed_local_naive=trimmed_local.replace(tzinfo=None),
-    )
+    timestamp_fields = _build_timestamp_fields(timestamp=timestamp, iso=event.timestamp_iso, local_timestamp=timestamp.astimezone())
 
-    level_text = event.level.severity.upper()
+    level = event.level
+    level_text, level_name, level_code, level_icon = _LEVEL_FIELDS[level]
 
     return FormatPayload(
         timestamps=timestamp_fields,
         level=level_text,
-        level_enum=event.level,
+        level_enum=level,
         LEVEL=level_text,
-        level_name=event.level.name,
-        level_code=event.level.code,
-        level_icon=event.level.icon,
+        level_name=level_name,
+        level_code=level_code,
+        level_icon=level_icon,
         logger_name=event.logger_name,
         event_id=event.event_id,
         message=event.message,
@@ -316,7 +563,7 @@ def build_format_payload(event: LogEvent) -> FormatPayload:
         user_name=context.user_name,
         hostname=context.hostname,
         process_id=context.process_id,
-        process_id_chain=_normalise_process_chain(formatted_chain),
+        process_id_chain=_normalise_process_chain(context.process_id_chain),
         theme=extra.get("theme"),
         pathname=extra.get("pathname"),
         lineno=extra.get("lineno"),
@@ -324,4 +571,4 @@ def build_format_payload(event: LogEvent) -> FormatPayload:
     )
 
 
-__all__ = ["FormatPayload", "TimestampFields", "build_format_payload"]
+__all__ = ["LEVEL_TEXT", "FormatPayload", "FormatPayloadView", "TemplateRenderer", "TimestampFields", "build_format_payload", "compile_template"]
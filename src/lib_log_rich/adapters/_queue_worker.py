@@ -22,8 +22,22 @@ When queue reaches capacity, behavior depends on drop_policy:
 - "drop_newest": Reject new item
 - "block": Wait for space (not recommended in async contexts)
 
+With ``soft_limit`` set, a share of events below WARNING is shed that rises
+linearly from 0 at the soft limit to all of them at capacity, keeping
+headroom for warnings and errors before the hard policy applies. Shedding is deterministic: a
+running debt accumulates the share per event and every whole unit drops one,
+so at half load past the limit every other low-severity event is shed.
+
+With ``codel_target`` set, the worker applies CoDel (RFC 8289) on dequeue:
+once events below WARNING have waited longer than the target for a whole
+``codel_interval``, stale ones are dropped at an increasing rate until the
+queue delay recovers (``queue_codel_drop`` diagnostic). This keeps a stalled
+sink from turning the queue into a standing backlog of old events.
+
 Items dropped trigger diagnostic callbacks with reason codes:
 - "queue_full": Queue at capacity
+- "soft_backpressure": Shed past ``soft_limit`` (the ``queue_dropped`` payload
+  carries this ``reason`` plus the ``load`` and ``qsize`` that triggered it)
 - "worker_failure": Worker thread crashed
 - "shutdown": Dropped during shutdown
 
@@ -38,6 +52,8 @@ to internal state during event processing.
 Performance Characteristics
 --------------------------
 - Queue operations: O(1)
+- Worker takes up to ``_BATCH_SIZE`` queued events per wakeup under one lock
+  acquisition and acknowledges them in one step
 - Shutdown drain: O(n) where n = queue size
 - Memory: O(maxsize * avg_event_size)
 - Typical event processing: <1ms per event
@@ -46,21 +62,50 @@ Performance Characteristics
 from __future__ import annotations
 
 import logging
+import math
 import queue
 import threading
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from lib_log_rich.domain.enums import QueuePolicy
-from lib_log_rich.domain.events import LogEvent
+from lib_log_rich.domain.levels import LogLevel
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from lib_log_rich.application.use_cases._types import DiagnosticCallback, DiagnosticPayload
+    from lib_log_rich.domain.events import LogEvent
 
 LOGGER = logging.getLogger(__name__)
 
+#: Upper bound on events taken from the queue per worker wakeup.
+_BATCH_SIZE = 64
+
+#: Events at or above this level are never shed by soft backpressure or CoDel.
+_PROTECTED_LEVEL = LogLevel.WARNING
+
+#: CoDel (RFC 8289, section 5.5): a drop episode starting within this many intervals of the last one resumes its rate.
+_CODEL_RESUME_INTERVALS = 16
+#: CoDel (RFC 8289, section 5.5): a resumed episode restarts its drop count this far below where it ended.
+_CODEL_RESUME_BACKOFF = 2
+
+
+class _Stamped:
+    """Queue entry pairing an event with its enqueue time for CoDel."""
+
+    __slots__ = ("enqueued_at", "event")
+
+    def __init__(self, event: LogEvent, enqueued_at: float) -> None:
+        """Wrap ``event`` with the monotonic time it entered the queue."""
+        self.event = event
+        self.enqueued_at = enqueued_at
+
+
+def _unwrap(item: LogEvent | _Stamped) -> LogEvent:
+    """Return the event held by a queue entry."""
+    return item.event if type(item) is _Stamped else cast("LogEvent", item)
+
 
 class QueueWorkerState:
     """Manage the queue worker thread and related bookkeeping."""
@@ -76,10 +121,20 @@ class QueueWorkerState:
         stop_timeout: float | None,
         diagnostic: DiagnosticCallback | None,
         failure_reset_after: float | None,
+        soft_limit: float | None = None,
+        codel_target: float | None = None,
+        codel_interval: float = 0.1,
     ) -> None:
         """Initialize the queue worker state with configuration options."""
+        if soft_limit is not None:
+            if not 0.0 < soft_limit < 1.0:
+                raise ValueError("soft_limit must be between 0 and 1 (exclusive)")
+            if maxsize <= 0:
+                raise ValueError("soft_limit requires a bounded queue (maxsize > 0)")
+        if codel_target is not None and (codel_target <= 0 or codel_interval <= 0):
+            raise ValueError("codel_target and codel_interval must be positive")
         self._worker = worker
-        self._queue: queue.Queue[LogEvent | None] = queue.Queue(maxsize=maxsize)
+        self._queue: queue.Queue[LogEvent | _Stamped | None] = queue.Queue(maxsize=maxsize)
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._drop_pending = False
@@ -94,6 +149,14 @@ class QueueWorkerState:
         self._worker_failed = False
         self._worker_failed_at: float | None = None
         self._degraded_drop_mode = False
+        self._soft_limit = soft_limit
+        self._shed_debt = 0.0
+        self._codel_target = codel_target
+        self._codel_interval = codel_interval
+        self._codel_first_above: float | None = None
+        self._codel_dropping = False
+        self._codel_drop_next = 0.0
+        self._codel_count = 0
 
     # Delegated operations -------------------------------------------------
 
@@ -202,33 +265,83 @@ class QueueWorkerState:
 
     def put(self, event: LogEvent) -> bool:
         """Enqueue ``event`` for asynchronous processing."""
+        if self._soft_limit is not None and self._shed_under_pressure(event):
+            return False
+
         effective_policy = self._drop_policy
         if effective_policy is QueuePolicy.BLOCK and self._worker_failed:
             effective_policy = QueuePolicy.DROP
             self._note_degraded_drop_mode()
 
+        if self._codel_target is not None:
+            return self._put_stamped(event, effective_policy)
+        return self._put_with_policy(event, event, effective_policy)
+
+    def _put_stamped(self, event: LogEvent, effective_policy: QueuePolicy) -> bool:
+        """Enqueue ``event`` in an entry carrying its enqueue time for CoDel.
+
+        Each entry holds its own stamp, so an event queued twice is timed twice.
+        A put that may have waited for space re-stamps the entry once it is in,
+        so time spent blocked outside the queue does not count as sojourn; the
+        worker sees one of the two stamps if it dequeues in between.
+        """
+        entry = _Stamped(event, time.monotonic())
+        accepted = self._put_with_policy(event, entry, effective_policy)
+        if accepted and effective_policy is not QueuePolicy.DROP:
+            entry.enqueued_at = time.monotonic()
+        return accepted
+
+    def _put_with_policy(self, event: LogEvent, entry: LogEvent | _Stamped, effective_policy: QueuePolicy) -> bool:
+        """Enqueue ``entry`` (``event`` or its stamped wrapper) according to ``effective_policy``."""
         if effective_policy is QueuePolicy.DROP:
             try:
-                self._queue.put(event, block=False)
+                self._queue.put(entry, block=False)
             except queue.Full:
                 self._handle_drop(event)
                 return False
-            self._drain_event.clear()
+            self._note_enqueued()
             return True
 
         if self._timeout is not None:
             try:
-                self._queue.put(event, timeout=self._timeout)
+                self._queue.put(entry, timeout=self._timeout)
             except queue.Full:
                 self._handle_drop(event)
                 return False
-            self._drain_event.clear()
+            self._note_enqueued()
             return True
 
-        self._queue.put(event)
-        self._drain_event.clear()
+        self._queue.put(entry)
+        self._note_enqueued()
         return True
 
+    def _shed_under_pressure(self, event: LogEvent) -> bool:
+        """Drop ``event`` early when the queue is past its soft limit; return ``True`` if shed."""
+        if event.level >= _PROTECTED_LEVEL:
+            return False
+        soft_limit = cast("float", self._soft_limit)
+        depth = self._queue.qsize()
+        load = depth / self._queue.maxsize
+        if load <= soft_limit:
+            return False
+        debt = self._shed_debt + (load - soft_limit) / (1.0 - soft_limit)
+        if debt < 1.0:
+            self._shed_debt = debt
+            return False
+        self._shed_debt = debt - 1.0
+        self._handle_drop(event, {"reason": "soft_backpressure", "load": load, "qsize": depth})
+        return True
+
+    def _note_enqueued(self) -> None:
+        """Clear the drain flag after a successful enqueue.
+
+        ``Event.clear`` takes the event's lock. While producers keep the queue
+        busy the flag is already clear, so the lock-free ``is_set`` read skips
+        that acquisition on the hot path.
+        """
+        if self._drain_event.is_set():
+            self._drain_event.clear()
+
     def set_worker(self, worker: Callable[[LogEvent], None]) -> None:
         """Swap the worker callable used to process events."""
         self._worker = worker
@@ -248,58 +361,160 @@ class QueueWorkerState:
 
     # Internal helpers -----------------------------------------------------
 
-    def _should_stop(self, item: LogEvent | None) -> bool:
-        """Check if worker should stop based on item and stop event."""
-        if item is None and self._stop_event.is_set():
-            return True
-        return self._stop_event.is_set() and self._queue.empty()
-
-    def _process_worker_item(self, item: LogEvent) -> None:
-        """Process a single log event through the worker."""
-        if self._worker is None:
-            return
+    def _process_worker_item(self, worker: Callable[[LogEvent], None], item: LogEvent) -> None:
+        """Process a single log event through ``worker``."""
         try:
-            self._worker(item)
+            worker(item)
         except Exception as exc:
             self._worker_failed = True
             self._worker_failed_at = time.monotonic()
             self._report_worker_exception(item, exc)
         else:
-            self._record_worker_success()
+            if self._worker_failed:
+                self._record_worker_success()
 
-    def _handle_queue_item(self, item: LogEvent | None) -> bool:
-        """Handle a single queue item, return True to continue processing."""
+    def _handle_queue_item(self, item: LogEvent | _Stamped | None, worker: Callable[[LogEvent], None] | None) -> bool:
+        """Handle a single queue item with ``worker``, return True to continue processing."""
         # Handle stop signal
         if item is None:
             return not self._stop_event.is_set()
 
+        # Stamped entries only exist while CoDel is enabled.
+        if type(item) is _Stamped:
+            event = item.event
+            enqueued_at: float | None = item.enqueued_at
+        else:
+            event = cast("LogEvent", item)
+            enqueued_at = None
+
         # Handle pending drops
         if self._drop_pending:
-            self._handle_drop(item)
+            self._handle_drop(event)
+            return True
+
+        if enqueued_at is not None and self._codel_should_drop(event, enqueued_at):
             return True
 
         # Process item with worker
-        if self._worker is not None:
-            self._process_worker_item(item)
+        if worker is not None:
+            self._process_worker_item(worker, event)
+
+        return True
+
+    def _codel_should_drop(self, item: LogEvent, enqueued_at: float) -> bool:
+        """Run the CoDel dequeue step for ``item``; drop and return ``True`` when it is stale.
+
+        Follows RFC 8289: the queue is "bad" once every event has waited longer
+        than ``codel_target`` for a full ``codel_interval``. While bad, drops
+        are spaced ``interval / sqrt(count)`` apart, so the drop rate rises
+        until the delay falls back under the target. Protected levels update
+        the delay estimate but are always delivered.
+        """
+        now = time.monotonic()
+        sojourn = now - enqueued_at
+        interval = self._codel_interval
+        ok_to_drop = False
+        if sojourn < cast("float", self._codel_target):
+            self._codel_first_above = None
+        elif self._codel_first_above is None:
+            self._codel_first_above = now + interval
+        elif now >= self._codel_first_above:
+            ok_to_drop = True
+        droppable = ok_to_drop and item.level < _PROTECTED_LEVEL
+
+        if self._codel_dropping:
+            if not ok_to_drop:
+                self._codel_dropping = False
+                return False
+            if not droppable or now < self._codel_drop_next:
+                return False
+            self._codel_count += 1
+            self._codel_drop_next += interval / math.sqrt(self._codel_count)
+        elif droppable:
+            # Resume near the previous drop rate if the last episode ended recently.
+            recent = now - self._codel_drop_next < _CODEL_RESUME_INTERVALS * interval
+            backoff = _CODEL_RESUME_BACKOFF
+            self._codel_count = self._codel_count - backoff if recent and self._codel_count > backoff else 1
+            self._codel_dropping = True
+            self._codel_drop_next = now + interval / math.sqrt(self._codel_count)
+        else:
+            return False
 
+        self._emit_diagnostic("queue_codel_drop", {"event_id": item.event_id, "sojourn": sojourn, "drop_count": self._codel_count})
+        self._handle_drop(item)
         return True
 
+    def _next_batch(self) -> list[LogEvent | _Stamped | None]:
+        """Block for one item, then take up to ``_BATCH_SIZE - 1`` already queued ones.
+
+        The rest of the batch is popped under a single ``mutex`` acquisition
+        instead of one ``get_nowait`` (and lock round-trip) per item, and
+        producers waiting on ``not_full`` are woken once for the whole batch.
+        The batch ends at the first stop signal, so items queued behind it stay
+        in the queue for shutdown handling and are never taken and put back.
+        """
+        pending_queue = self._queue
+        first = pending_queue.get()
+        batch = [first]
+        if first is None:
+            return batch
+        with pending_queue.mutex:
+            items = pending_queue.queue
+            for _ in range(min(len(items), _BATCH_SIZE - 1)):
+                item = items.popleft()
+                batch.append(item)
+                if item is None:
+                    break
+            if len(batch) > 1:
+                pending_queue.not_full.notify(len(batch) - 1)
+        return batch
+
+    def _finish_batch(self, batch: list[LogEvent | _Stamped | None], done: int) -> None:
+        """Acknowledge every item of ``batch`` with one task-accounting update.
+
+        Items after ``done`` are only left when handling raised; they are
+        reported as drops because they have already left the queue, and putting
+        them back could overfill it.
+        """
+        for item in batch[done:]:
+            if item is not None:
+                self._handle_drop(_unwrap(item))
+        pending_queue = self._queue
+        # One ``task_done`` for the whole batch instead of one per item.
+        with pending_queue.all_tasks_done:
+            unfinished = pending_queue.unfinished_tasks - len(batch)
+            pending_queue.unfinished_tasks = unfinished
+            if unfinished == 0:
+                pending_queue.all_tasks_done.notify_all()
+        # Only a busy -> idle transition needs the Event's lock and wakeup;
+        # batches that end on an already idle queue (raw enqueues) skip it.
+        if unfinished == 0 and not self._drain_event.is_set():
+            self._drain_event.set()
+
     def _run(self) -> None:
         while True:
-            item = self._queue.get()
+            batch = self._next_batch()
+            # Read once per batch; a ``set_worker`` swap applies from the next batch.
+            worker = self._worker
+            handle = self._handle_queue_item
+            size = len(batch)
+            done = 0
+            stop = False
             try:
-                should_continue = self._handle_queue_item(item)
-                if not should_continue:
-                    break
+                for item in batch:
+                    done += 1
+                    if not handle(item, worker):
+                        stop = True
+                        break
+                    if (item is None or done == size) and self._stop_event.is_set() and (item is None or self._queue.empty()):
+                        stop = True
+                        break
             finally:
-                self._queue.task_done()
-                if self._queue.unfinished_tasks == 0:
-                    self._drain_event.set()
-
-            if self._should_stop(item):
+                self._finish_batch(batch, done)
+            if stop:
                 break
 
-    def _handle_drop(self, event: LogEvent) -> None:
+    def _handle_drop(self, event: LogEvent, details: DiagnosticPayload | None = None) -> None:
         payload = {
             "event_id": getattr(event, "event_id", None),
             "logger": getattr(event, "logger_name", None),
@@ -326,6 +541,8 @@ class QueueWorkerState:
                 payload.get("logger"),
                 payload.get("level"),
             )
+        if details is not None:
+            payload.update(details)
         self._emit_diagnostic("queue_dropped", payload)
 
     def _report_worker_exception(self, event: LogEvent, exc: Exception) -> None:
@@ -373,8 +590,8 @@ class QueueWorkerState:
             except queue.Empty:  # noqa: PERF203 - poll-until-empty idiom, break is the exit condition
                 break
             else:
-                if isinstance(dropped, LogEvent):
-                    self._handle_drop(dropped)
+                if dropped is not None:
+                    self._handle_drop(_unwrap(dropped))
                 self._queue.task_done()
         self._drain_event.set()
 
@@ -402,8 +619,8 @@ class QueueWorkerState:
             dropped = self._queue.get_nowait()
         except queue.Empty:
             return
-        if isinstance(dropped, LogEvent):
-            self._handle_drop(dropped)
+        if dropped is not None:
+            self._handle_drop(_unwrap(dropped))
         self._queue.task_done()
 
     def enqueue_raw(self, item: LogEvent | None) -> None:
@@ -162,10 +162,14 @@ class LogEventPayload(BaseModel):
         raise TypeError("event extras must be a mapping")
 
     @classmethod
-    def from_event(cls, event: LogEvent) -> LogEventPayload:
-        """Create a payload from a domain event."""
+    def from_event(cls, event: LogEvent, *, context: LogContextPayload | None = None) -> LogEventPayload:
+        """Create a payload from a domain event.
+
+        ``context`` lets callers pass an already validated context payload so
+        batches of events sharing one :class:`LogContext` validate it once.
+        """
         level: LogLevel = event.level
-        context_payload = LogContextPayload.from_context(event.context)
+        context_payload = context if context is not None else LogContextPayload.from_context(event.context)
         return cls(
             event_id=event.event_id,
             timestamp=event.timestamp,
@@ -34,7 +34,7 @@ from rich.console import Console
 from lib_log_rich.application.ports.console import ConsolePort
 from lib_log_rich.domain.levels import LogLevel
 
-from .._formatting import build_format_payload
+from .._formatting import FormatPayloadView, compile_template
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -187,14 +187,8 @@ class RichConsoleAdapter(ConsolePort):
             self._console = self._build_console(stream, stream_target, force_color=force_color, no_color=no_color)
         self._force_color = force_color
         self._no_color = no_color
-        if styles:
-            merged = dict(_STYLE_MAP)
-            for key, value in styles.items():
-                level = LogLevel.from_name(key)
-                merged[level] = value
-            self._style_map = merged
-        else:
-            self._style_map = dict(_STYLE_MAP)
+        # LogLevel.from_name is lru_cached and still rejects unknown level names.
+        self._style_map = {**_STYLE_MAP, **{LogLevel.from_name(key): value for key, value in styles.items()}} if styles else dict(_STYLE_MAP)
         self._template, self._template_source = _resolve_template(format_preset, format_template)
 
     def emit(self, event: LogEvent, *, colorize: bool) -> None:
@@ -237,15 +231,15 @@ class RichConsoleAdapter(ConsolePort):
             When both the custom template and fallback preset fail to render.
 
         """
-        payload = build_format_payload(event).to_dict()
+        payload = FormatPayloadView(event)
         template = self._template
         try:
-            return template.format(**payload)
+            return compile_template(template)(payload)
         except Exception:
             if self._template_source != "full":
                 fallback = _CONSOLE_PRESETS["full"]
                 try:
-                    return fallback.format(**payload)
+                    return compile_template(fallback)(payload)
                 except Exception as exc:  # pragma: no cover - defensive
                     raise ValueError("Console format template failed to render") from exc
             raise
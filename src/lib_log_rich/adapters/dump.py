@@ -32,7 +32,8 @@ from __future__ import annotations
 import html
 from functools import cache, lru_cache
 from io import StringIO
-from typing import TYPE_CHECKING, Any, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import orjson
 from rich.console import Console
@@ -42,41 +43,56 @@ from lib_log_rich.application.ports.dump import DumpPort
 from lib_log_rich.domain.dump import DumpFormat
 from lib_log_rich.domain.levels import LogLevel
 
-from ._formatting import build_format_payload
-from ._schemas import LogEventPayload
+from ._formatting import LEVEL_TEXT, FormatPayloadView, compile_template
+from ._schemas import LogContextPayload, LogEventPayload
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, Sequence
+    from collections.abc import Callable, Mapping, Sequence
     from pathlib import Path
 
     from lib_log_rich.domain.dump_filter import DumpFilter
     from lib_log_rich.domain.events import LogEvent
 
+#: Characters per write when persisting dumps; bounds the encoder's temporary buffer.
+_WRITE_CHUNK_CHARS: int = 1 << 20
+
+#: Pre-rendered ``<td>`` level cells for the HTML table dump.
+_HTML_LEVEL_CELLS: dict[LogLevel, str] = {level: f"<td>{html.escape(text)}</td>" for level, text in LEVEL_TEXT.items()}
+
 # Invisible marker character for ANSI style extraction
 # Used as a placeholder to capture Rich's ANSI prefix/suffix sequences
 _STYLE_EXTRACTION_MARKER: str = "\u0000"
 
+#: Shared empty style mapping returned when no overrides or theme apply.
+_EMPTY_STYLES: Mapping[str, str] = MappingProxyType({})
+_EMPTY_STYLES_BY_THEME: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+
 
 @cache
-def _load_console_themes() -> dict[str, dict[str, str]]:
+def _load_console_themes() -> Mapping[str, Mapping[str, str]]:
     """Load console themes from the domain palette module (cached).
 
+    Palettes are normalised and frozen once, so callers can hand them out
+    directly without copying.
+
     Returns
     -------
-    dict[str, dict[str, str]]
-        Mapping of theme names to level->style dictionaries (uppercase levels).
+    Mapping[str, Mapping[str, str]]
+        Mapping of theme names to read-only level->style palettes (uppercase levels).
 
     Examples
     --------
-    >>> isinstance(_load_console_themes(), dict)
-    True
+    >>> _load_console_themes()["classic"]["INFO"]
+    'cyan'
 
     """
     try:  # pragma: no cover - defensive import guard
         from lib_log_rich.domain.palettes import CONSOLE_STYLE_THEMES  # noqa: PLC0415 - guarded against early-bootstrap ImportError
     except ImportError:  # pragma: no cover - happens during early bootstrap
-        return {}
-    return {name.lower(): {level.upper(): style for level, style in palette.items()} for name, palette in CONSOLE_STYLE_THEMES.items()}
+        return _EMPTY_STYLES_BY_THEME
+    return MappingProxyType(
+        {name.lower(): MappingProxyType({level.upper(): style for level, style in palette.items()}) for name, palette in CONSOLE_STYLE_THEMES.items()}
+    )
 
 
 def _create_rich_console_for_dump() -> Console:
@@ -110,18 +126,43 @@ def _create_style_wrapper(rich_console: Console, style: str) -> tuple[str, str]:
     return (prefix, suffix)
 
 
+@lru_cache(maxsize=32)
+def _style_wrapper(style: str) -> tuple[str, str]:
+    """Return the cached ANSI ``(prefix, suffix)`` pair for ``style``.
+
+    Rich is consulted once per style string for the lifetime of the process,
+    so colourised dumps never touch Rich per event or per dump.
+
+    Examples
+    --------
+    >>> _style_wrapper("cyan")
+    ('\\x1b[36m', '\\x1b[0m')
+
+    """
+    return _create_style_wrapper(_create_rich_console_for_dump(), style)
+
+
+def _event_theme(event: LogEvent) -> str | None:
+    """Return the per-event theme override from ``extra`` when it is a string."""
+    theme = event.extra.get("theme")
+    return theme if isinstance(theme, str) else None
+
+
 def _resolve_event_style(
-    event: LogEvent,
+    level: LogLevel,
+    event_theme: str | None,
     *,
-    resolved_styles: dict[str, str],
-    theme_styles: dict[str, str],
+    resolved_styles: Mapping[str, str],
+    theme_styles: Mapping[str, str],
 ) -> str | None:
-    """Determine the Rich style string for an event based on level and theme.
+    """Determine the Rich style string for a level/theme combination.
 
     Parameters
     ----------
-    event:
-        Log event to style.
+    level:
+        Level of the event to style.
+    event_theme:
+        Theme override carried by the event (``extra["theme"]``), if any.
     resolved_styles:
         Explicit style overrides keyed by level name.
     theme_styles:
@@ -134,59 +175,32 @@ def _resolve_event_style(
 
     """
     # Check explicit style overrides first
-    style_name = resolved_styles.get(event.level.name)
+    style_name = resolved_styles.get(level.name)
     if style_name is not None:
         return style_name
 
-    # Check event-specific theme override
-    event_theme = None
-    try:
-        event_theme = event.extra.get("theme")
-    except AttributeError:
-        event_theme = None
-
     # Resolve palette (event theme > default theme)
-    palette = _resolve_theme_styles(event_theme) or theme_styles if isinstance(event_theme, str) else theme_styles
+    palette = _resolve_theme_styles(event_theme) or theme_styles if event_theme else theme_styles
 
     # Lookup level in palette
     if palette:
-        return palette.get(event.level.name)
+        return palette.get(level.name)
 
     return None
 
 
-def _apply_fallback_ansi_color(line: str, level: LogLevel) -> str:
-    """Apply simple ANSI color to line based on log level.
-
-    Parameters
-    ----------
-    line:
-        Text line to colorize.
-    level:
-        Log level determining color choice.
+#: ANSI colours applied when neither overrides nor themes style a level.
+_FALLBACK_ANSI_COLOURS: dict[LogLevel, str] = {
+    LogLevel.DEBUG: "\u001b[36m",  # cyan
+    LogLevel.INFO: "\u001b[32m",  # green
+    LogLevel.WARNING: "\u001b[33m",  # yellow
+    LogLevel.ERROR: "\u001b[31m",  # red
+    LogLevel.CRITICAL: "\u001b[35m",  # magenta
+}
+_ANSI_RESET: str = "\u001b[0m"
 
-    Returns
-    -------
-    str:
-        Line wrapped in ANSI color codes if level has a fallback color.
 
-    """
-    fallback_colours = {
-        LogLevel.DEBUG: "\u001b[36m",  # cyan
-        LogLevel.INFO: "\u001b[32m",  # green
-        LogLevel.WARNING: "\u001b[33m",  # yellow
-        LogLevel.ERROR: "\u001b[31m",  # red
-        LogLevel.CRITICAL: "\u001b[35m",  # magenta
-    }
-    reset = "\u001b[0m"
-
-    colour = fallback_colours.get(level)
-    if colour:
-        return f"{colour}{line}{reset}"
-    return line
-
-
-def _normalise_styles(styles: Mapping[str, str] | None) -> dict[str, str]:
+def _normalise_styles(styles: Mapping[str, str] | None) -> Mapping[str, str]:
     """Convert mixed keys to uppercase level names for palette lookups.
 
     Parameters
@@ -196,30 +210,37 @@ def _normalise_styles(styles: Mapping[str, str] | None) -> dict[str, str]:
 
     Returns
     -------
-    dict[str, str]
-        Dictionary keyed by uppercase strings.
+    Mapping[str, str]
+        Read-only mapping keyed by uppercase strings, shared between dumps that
+        pass the same overrides.
 
     Examples
     --------
-    >>> _normalise_styles({LogLevel.INFO: 'green', 'error': 'red'})
+    >>> dict(_normalise_styles({LogLevel.INFO: 'green', 'error': 'red'}))
     {'INFO': 'green', 'ERROR': 'red'}
 
     """
     if not styles:
-        return {}
+        return _EMPTY_STYLES
+    return _normalise_style_items(tuple(styles.items()))
+
+
+@lru_cache(maxsize=16)
+def _normalise_style_items(items: tuple[tuple[LogLevel | str, str], ...]) -> Mapping[str, str]:
+    """Cached worker behind :func:`_normalise_styles` keyed by the override items."""
     normalised: dict[str, str] = {}
-    for key, value in styles.items():
+    for key, value in items:
         if isinstance(key, LogLevel):
             normalised[key.name] = value
         else:
             norm_key = str(key).strip().upper()
             if norm_key:
                 normalised[norm_key] = value
-    return normalised
+    return MappingProxyType(normalised)
 
 
 @lru_cache(maxsize=8)
-def _resolve_theme_styles(theme: str | None) -> dict[str, str]:
+def _resolve_theme_styles(theme: str | None) -> Mapping[str, str]:
     """Fetch style overrides for the selected theme (if any).
 
     Parameters
@@ -229,19 +250,18 @@ def _resolve_theme_styles(theme: str | None) -> dict[str, str]:
 
     Returns
     -------
-    dict[str, str]
-        Palette mapping or empty dict when theme is ``None`` or unknown.
+    Mapping[str, str]
+        Read-only palette mapping, empty when theme is ``None`` or unknown.
 
     Examples
     --------
-    >>> isinstance(_resolve_theme_styles(None), dict)
-    True
+    >>> len(_resolve_theme_styles(None))
+    0
 
     """
     if not theme:
-        return {}
-    palette = _load_console_themes().get(theme.strip().lower())
-    return dict(palette) if palette else {}
+        return _EMPTY_STYLES
+    return _load_console_themes().get(theme.strip().lower()) or _EMPTY_STYLES
 
 
 #: Fallback colour styles used when neither theme nor explicit styles provide mappings.
@@ -253,6 +273,9 @@ _FALLBACK_HTML_STYLES: dict[LogLevel, str] = {
     LogLevel.CRITICAL: "magenta",
 }
 
+#: Template used by text and HTML text dumps when neither preset nor template is given.
+_DEFAULT_TEXT_TEMPLATE: str = "{timestamp} {LEVEL:<8} {logger_name} {event_id} {message}"
+
 #: Named text presets mirrored in CLI documentation for predictable dumps.
 _TEXT_PRESETS: dict[str, str] = {
     "full": "{timestamp} {LEVEL:<8} {logger_name} {event_id} {message}{context_fields}",
@@ -335,11 +358,17 @@ class DumpAdapter(DumpPort):
 
     @staticmethod
     def _write_to_path(path: Path, content: str) -> None:
-        """Write content to filesystem path, creating parent directories if needed."""
+        """Write content to filesystem path, creating parent directories if needed.
+
+        The content is written in :data:`_WRITE_CHUNK_CHARS` slices so the
+        UTF-8 encoder never materialises a second full-size copy of large dumps.
+        """
         parent = path.parent
         if not parent.exists():
             parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        with path.open("w", encoding="utf-8") as handle:
+            for start in range(0, len(content), _WRITE_CHUNK_CHARS):
+                handle.write(content[start : start + _WRITE_CHUNK_CHARS])
 
     def dump(
         self,
@@ -369,37 +398,44 @@ class DumpAdapter(DumpPort):
         return content
 
     @staticmethod
-    def _format_event_line(event: LogEvent, pattern: str) -> str:
-        """Format a single event using the given template pattern."""
-        data = build_format_payload(event).to_dict()
+    def _line_formatter(pattern: str) -> Callable[[LogEvent], str]:
+        """Compile ``pattern`` once and return a formatter applied per event."""
         try:
-            return pattern.format(**data)
-        except KeyError as exc:
-            raise ValueError(f"Unknown placeholder in text template: {exc}") from exc
+            render = compile_template(pattern)
         except ValueError as exc:
             raise ValueError(f"Invalid format specification in template: {exc}") from exc
 
+        def format_line(event: LogEvent) -> str:
+            try:
+                return render(FormatPayloadView(event))
+            except KeyError as exc:
+                raise ValueError(f"Unknown placeholder in text template: {exc}") from exc
+            except ValueError as exc:
+                raise ValueError(f"Invalid format specification in template: {exc}") from exc
+
+        return format_line
+
     @staticmethod
-    def _colorize_line(
-        line: str,
-        event: LogEvent,
+    def _line_wrapper(
+        level: LogLevel,
+        event_theme: str | None,
         *,
-        rich_console: Console,
-        style_wrappers: dict[str, tuple[str, str]],
-        resolved_styles: dict[str, str],
-        theme_styles: dict[str, str],
-    ) -> str:
-        """Apply colorization to a line using Rich styles or ANSI fallback."""
-        style_name = _resolve_event_style(event, resolved_styles=resolved_styles, theme_styles=theme_styles)
+        resolved_styles: Mapping[str, str],
+        theme_styles: Mapping[str, str],
+    ) -> tuple[str, str]:
+        """Return the ``(prefix, suffix)`` ANSI pair colouring a level/theme combination.
+
+        Rich styles are converted via :func:`_style_wrapper`; levels without a
+        style use the ANSI fallback colours. ``("", "")`` leaves the line untouched.
+        """
+        style_name = _resolve_event_style(level, event_theme, resolved_styles=resolved_styles, theme_styles=theme_styles)
 
         if style_name:
-            # Use cached wrapper or create new one
-            if style_name not in style_wrappers:
-                style_wrappers[style_name] = _create_style_wrapper(rich_console, style_name)
-            start, end = style_wrappers[style_name]
-            return f"{start}{line}{end}" if start and end else line
+            start, end = _style_wrapper(style_name)
+            return (start, end) if start and end else ("", "")
 
-        return _apply_fallback_ansi_color(line, event.level)
+        colour = _FALLBACK_ANSI_COLOURS.get(level)
+        return (colour, _ANSI_RESET) if colour else ("", "")
 
     @staticmethod
     def _render_text(
@@ -414,63 +450,47 @@ class DumpAdapter(DumpPort):
         if not events:
             return ""
 
-        pattern = template or "{timestamp} {LEVEL:<8} {logger_name} {event_id} {message}"
+        format_line = DumpAdapter._line_formatter(template or _DEFAULT_TEXT_TEMPLATE)
+
+        if not colorize:
+            return "\n".join([format_line(event) for event in events])
+
         resolved_styles = _normalise_styles(console_styles)
         theme_styles = _resolve_theme_styles(theme)
-
-        rich_console = _create_rich_console_for_dump() if colorize else None
-        style_wrappers: dict[str, tuple[str, str]] = {}
+        # Styling only depends on (level, event theme); resolve each pair once per dump.
+        wrappers: dict[tuple[LogLevel, str | None], tuple[str, str]] = {}
 
         lines: list[str] = []
         for event in events:
-            line = DumpAdapter._format_event_line(event, pattern)
-
-            if colorize and rich_console is not None:
-                line = DumpAdapter._colorize_line(
-                    line, event, rich_console=rich_console, style_wrappers=style_wrappers, resolved_styles=resolved_styles, theme_styles=theme_styles
-                )
-
-            lines.append(line)
+            line = format_line(event)
+            key = (event.level, _event_theme(event))
+            wrapper = wrappers.get(key)
+            if wrapper is None:
+                wrapper = wrappers[key] = DumpAdapter._line_wrapper(*key, resolved_styles=resolved_styles, theme_styles=theme_styles)
+            start, end = wrapper
+            lines.append(f"{start}{line}{end}" if start else line)
         return "\n".join(lines)
 
-    @staticmethod
-    def _get_event_theme(event: LogEvent) -> str | None:
-        """Extract theme from event extra if present."""
-        try:
-            theme = event.extra.get("theme")
-            return theme if isinstance(theme, str) else None
-        except AttributeError:
-            return None
-
-    @staticmethod
-    def _resolve_palette(event_theme: str | None, theme_styles: dict[str, str]) -> dict[str, str]:
-        """Resolve the palette to use based on event theme or default."""
-        if event_theme:
-            return _resolve_theme_styles(event_theme) or theme_styles
-        return theme_styles
-
     @staticmethod
     def _resolve_html_style(
-        event: LogEvent,
+        level: LogLevel,
+        event_theme: str | None,
         *,
-        colorize: bool,
-        resolved_styles: dict[str, str],
-        theme_styles: dict[str, str],
+        resolved_styles: Mapping[str, str],
+        theme_styles: Mapping[str, str],
     ) -> str | None:
-        """Resolve Rich style for HTML rendering."""
-        if not colorize:
-            return None
+        """Resolve Rich style for HTML rendering of a level/theme combination."""
         # Check explicit style overrides first
-        style_name = resolved_styles.get(event.level.name)
+        style_name = resolved_styles.get(level.name)
         if style_name:
             return style_name
         # Resolve palette from event or default theme
-        palette = DumpAdapter._resolve_palette(DumpAdapter._get_event_theme(event), theme_styles)
+        palette = (_resolve_theme_styles(event_theme) or theme_styles) if event_theme else theme_styles
         if palette:
-            style_name = palette.get(event.level.name)
+            style_name = palette.get(level.name)
             if style_name:
                 return style_name
-        return _FALLBACK_HTML_STYLES.get(event.level)
+        return _FALLBACK_HTML_STYLES.get(level)
 
     @staticmethod
     def _create_html_console() -> Console:
@@ -496,20 +516,30 @@ class DumpAdapter(DumpPort):
         if not events:
             return "<html><head><title>lib_log_rich dump</title></head><body></body></html>"
 
-        pattern = template or "{timestamp} {LEVEL:<8} {logger_name} {event_id} {message}"
+        format_line = DumpAdapter._line_formatter(template or _DEFAULT_TEXT_TEMPLATE)
         resolved_styles = _normalise_styles(console_styles)
         theme_styles = _resolve_theme_styles(theme)
         console = DumpAdapter._create_html_console()
-
-        for event in events:
-            line = DumpAdapter._format_event_line(event, pattern)
-            style_name = DumpAdapter._resolve_html_style(event, colorize=colorize, resolved_styles=resolved_styles, theme_styles=theme_styles)
-
-            console.print(
-                Text(line, style=style_name if colorize and style_name else ""),
-                markup=False,
-                highlight=False,
-            )
+        # Styling only depends on (level, event theme); resolve each pair once per dump.
+        styles: dict[tuple[LogLevel, str | None], str] = {}
+        # One Text holding every line (each styled as its own span) lets Rich
+        # lay out and record the whole dump in a single print call.
+        document = Text()
+
+        for index, event in enumerate(events):
+            line = format_line(event)
+            style_name = ""
+            if colorize:
+                key = (event.level, _event_theme(event))
+                cached = styles.get(key)
+                if cached is None:
+                    cached = styles[key] = DumpAdapter._resolve_html_style(*key, resolved_styles=resolved_styles, theme_styles=theme_styles) or ""
+                style_name = cached
+            if index:
+                document.append("\n")
+            document.append(line, style=style_name or None)
+
+        console.print(document, markup=False, highlight=False)
 
         html_output = console.export_html(theme=None, clear=False)
         console.clear()
@@ -535,40 +565,36 @@ class DumpAdapter(DumpPort):
         '[]'
 
         """
-        payload = [LogEventPayload.from_event(event).model_dump(mode="json") for event in events]
+        # Events from one request/job share a LogContext; validate each once.
+        # Keying by id() is safe because ``events`` keeps every context alive.
+        contexts: dict[int, LogContextPayload] = {}
+        payload: list[dict[str, Any]] = []
+        for event in events:
+            context = contexts.get(id(event.context))
+            if context is None:
+                context = contexts[id(event.context)] = LogContextPayload.from_context(event.context)
+            payload.append(LogEventPayload.from_event(event, context=context).model_dump(mode="json"))
         return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
 
-    @staticmethod
-    def _format_process_chain_html(chain_raw: Any) -> str:
-        """Format process ID chain for HTML table display."""
-        if isinstance(chain_raw, (list, tuple)):
-            chain_iter = cast("Iterable[object]", chain_raw)
-            chain_parts = [str(part) for part in chain_iter]
-        elif chain_raw:
-            chain_parts = [str(chain_raw)]
-        else:
-            chain_parts = []
-        return ">".join(chain_parts) if chain_parts else ""
-
     @staticmethod
     def _build_html_table_row(event: LogEvent) -> str:
         """Build a single HTML table row for an event.
 
-        Uses direct attribute access on LogContext dataclass.
+        Uses direct attribute access on LogContext dataclass. ISO timestamps,
+        level labels, and integer PID chains cannot contain HTML metacharacters
+        other than the chain separator, so only free-text cells are escaped.
         """
         context = event.context
-        chain_str = DumpAdapter._format_process_chain_html(context.process_id_chain)
+        chain_cell = "&gt;".join(map(str, context.process_id_chain))
         return (
-            "<tr>"
-            f"<td>{html.escape(event.timestamp.isoformat())}</td>"
-            f"<td>{html.escape(event.level.severity.upper())}</td>"
+            f"<tr><td>{event.timestamp.isoformat()}</td>"
+            f"{_HTML_LEVEL_CELLS[event.level]}"
             f"<td>{html.escape(event.logger_name)}</td>"
             f"<td>{html.escape(event.message)}</td>"
             f"<td>{html.escape(str(context.user_name or ''))}</td>"
             f"<td>{html.escape(str(context.hostname or ''))}</td>"
             f"<td>{html.escape(str(context.process_id or ''))}</td>"
-            f"<td>{html.escape(chain_str)}</td>"
-            "</tr>"
+            f"<td>{chain_cell}</td></tr>"
         )
 
     @staticmethod
@@ -581,8 +607,7 @@ class DumpAdapter(DumpPort):
         True
 
         """
-        rows = [DumpAdapter._build_html_table_row(event) for event in events]
-        table = "".join(rows)
+        table = "".join([DumpAdapter._build_html_table_row(event) for event in events])
         return (
             "<html><head><title>lib_log_rich dump</title></head><body>"
             "<table>"
@@ -68,8 +68,25 @@ class QueueAdapter(QueuePort):
         stop_timeout: float | None = DEFAULT_QUEUE_STOP_TIMEOUT,
         diagnostic: DiagnosticCallback | None = None,
         failure_reset_after: float | None = 30.0,
+        soft_limit: float | None = None,
+        codel_target: float | None = None,
+        codel_interval: float = 0.1,
     ) -> None:
-        """Initialize the queue adapter with worker and backpressure settings."""
+        """Initialize the queue adapter with worker and backpressure settings.
+
+        ``soft_limit`` (fraction of ``maxsize``, disabled by default) enables
+        early shedding of a load-proportional share of events below WARNING
+        once the queue fills past that depth, before ``drop_policy`` has to act
+        at capacity. It is adapter-only: ``RuntimeSettings`` and the
+        composition root never pass it, so only a directly constructed
+        ``QueueAdapter`` can enable it.
+
+        ``codel_target`` (seconds, disabled by default) enables CoDel on the
+        worker side: when events below WARNING have waited longer than the
+        target for a whole ``codel_interval``, stale ones are dropped at an
+        increasing rate until the queue delay recovers. Like ``soft_limit`` it is
+        adapter-only.
+        """
         state = QueueWorkerState(
             worker=worker,
             maxsize=maxsize,
@@ -79,6 +96,9 @@ class QueueAdapter(QueuePort):
             stop_timeout=stop_timeout,
             diagnostic=diagnostic,
             failure_reset_after=failure_reset_after,
+            soft_limit=soft_limit,
+            codel_target=codel_target,
+            codel_interval=codel_interval,
         )
         self._state = state
         self._debug_view = QueueAdapterDebug(state)
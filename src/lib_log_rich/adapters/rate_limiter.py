@@ -22,7 +22,7 @@ Configuration shape (max events, interval) matches the options referenced in
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from collections import deque
 from typing import TYPE_CHECKING
 
 from lib_log_rich.application.ports.rate_limiter import RateLimiterPort
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from datetime import timedelta
 
     from lib_log_rich.domain.events import LogEvent
+    from lib_log_rich.domain.levels import LogLevel
 
 
 class SlidingWindowRateLimiter(RateLimiterPort):
@@ -62,42 +63,48 @@ class SlidingWindowRateLimiter(RateLimiterPort):
         """Initialise the limiter with capacity and sliding window size."""
         self._max_events = max_events
         self._interval = interval
-        self._buckets: dict[tuple[str, str], deque[float]] = defaultdict(deque)
+        self._window_seconds = interval.total_seconds()
+        # Buckets are grouped per level and keyed by logger name, so a lookup
+        # hashes one (cached) string and never allocates a key tuple.
+        self._buckets: dict[LogLevel, dict[str, deque[float]]] = {}
 
     def allow(self, event: LogEvent) -> bool:
         """Return ``True`` when ``event`` is within the configured quota.
 
         Implements sliding window rate limiting per (logger_name, severity) bucket:
 
-        1. Retrieve or create a deque of timestamps for this bucket
-        2. Remove all timestamps older than the current window
-        3. Check if bucket has capacity for one more event
-        4. If yes, record this event's timestamp and allow it
-        5. If no, reject the event (rate limit exceeded)
+        1. Retrieve or create the bucket holding the last ``max_events``
+           accepted timestamps (a bounded deque)
+        2. If the bucket is full and its oldest timestamp is still inside the
+           window, reject the event (rate limit exceeded)
+        3. Otherwise record this event's timestamp, which pushes the oldest
+           one out of a full bucket, and allow it
+
+        Each call is O(1): expired timestamps are displaced by ``append``
+        rather than evicted in a loop.
 
         Note:
             NOT thread-safe. Caller must ensure exclusive access if used across threads.
 
         """
-        # Use (logger_name, severity) as bucket key to track quotas independently
-        # per logger/level combination (e.g., "app.worker" at ERROR vs DEBUG)
-        key = (event.logger_name, event.level.severity)
-        bucket = self._buckets[key]
-
-        # Calculate the sliding window: all events within [cutoff, now] are counted
+        # Track quotas independently per logger/level combination
+        # (e.g., "app.worker" at ERROR vs DEBUG)
+        level_buckets = self._buckets.get(event.level)
+        if level_buckets is None:
+            level_buckets = self._buckets[event.level] = {}
+        bucket = level_buckets.get(event.logger_name)
+        if bucket is None:
+            bucket = level_buckets[event.logger_name] = deque(maxlen=max(self._max_events, 0))
+
+        # Calculate the sliding window: all events within (cutoff, now] are counted
         now = event.timestamp.timestamp()
-        cutoff = now - self._interval.total_seconds()
-
-        # Evict expired timestamps from left (oldest) side of deque
-        # This maintains the sliding window by removing events outside the interval
-        while bucket and bucket[0] <= cutoff:
-            bucket.popleft()
 
-        # Reject if we've already hit the quota within this window
-        if len(bucket) >= self._max_events:
+        # A full bucket whose oldest entry is still inside the window means
+        # max_events were accepted within the interval: reject.
+        if len(bucket) == bucket.maxlen and (not bucket or bucket[0] > now - self._window_seconds):
             return False
 
-        # Accept the event and record its timestamp for future checks
+        # Accept the event; a full deque drops its oldest (expired) timestamp
         bucket.append(now)
         return True
 
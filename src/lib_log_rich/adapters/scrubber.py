@@ -21,14 +21,54 @@ from __future__ import annotations
 import re
 from collections.abc import Mapping, Sequence
 from functools import lru_cache
+from itertools import islice
 from re import Pattern
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from lib_log_rich.application.ports.scrubber import ScrubberPort
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from lib_log_rich.domain.events import LogEvent
 
+#: Upper bound on raw field names memoised per scrubber.
+_KEY_CACHE_LIMIT = 1024
+_UNSEEN = object()
+
+
+def _load_regex_engine(engine: str) -> Callable[[str], Pattern[str]]:
+    """Return the pattern compiler for the requested regex ``engine``.
+
+    ``"re2"`` selects google-re2 (linear-time matching, no backtracking) and
+    requires the ``re2`` extra. Patterns RE2 cannot compile, such as
+    backreferences or lookarounds, fall back to :mod:`re`, so the returned
+    compiler only raises :class:`re.error`.
+    """
+    if engine == "re":
+        return re.compile
+    if engine == "re2":
+        try:
+            import re2  # type: ignore[import-not-found]  # noqa: PLC0415 - optional dependency, guarded by ImportError
+        except ImportError as exc:
+            raise RuntimeError("google-re2 is required for engine='re2' (install lib_log_rich[re2])") from exc
+        module = cast("Any", re2)
+        re2_error = cast("type[Exception]", module.error)
+
+        def compile_pattern(pattern: str) -> Pattern[str]:
+            try:
+                return cast("Pattern[str]", module.compile(pattern))
+            except re2_error:
+                return re.compile(pattern)
+
+        return compile_pattern
+    raise ValueError(f"Unsupported scrub regex engine: {engine!r}")
+
+
+def _keep_value(_scrubber: RegexScrubber, value: Any, _pattern: Pattern[str]) -> Any:
+    """Return scalars that can never hold a secret string unchanged."""
+    return value
+
 
 class RegexScrubber(ScrubberPort):
     """Redact sensitive fields using regular expressions.
@@ -39,6 +79,8 @@ class RegexScrubber(ScrubberPort):
     Args:
         patterns: Mapping of field name → regex string; matching values are redacted.
         replacement: Token replacing matched values (defaults to ``"***"``).
+        engine: Regex engine, ``"re"`` (default) or ``"re2"`` for linear-time
+            matching of untrusted payloads.
 
     Example:
         >>> from datetime import datetime, timezone
@@ -53,22 +95,28 @@ class RegexScrubber(ScrubberPort):
 
     """
 
-    def __init__(self, *, patterns: dict[str, str], replacement: str = "***") -> None:
+    def __init__(self, *, patterns: dict[str, str], replacement: str = "***", engine: str = "re") -> None:
         """Compile the provided ``patterns`` and store the replacement token.
 
         Raises:
-            ValueError: If a pattern is invalid or cannot be compiled.
+            ValueError: If a pattern is invalid or cannot be compiled, or the
+                engine is unknown.
+            RuntimeError: If ``engine="re2"`` and google-re2 is not installed.
         """
+        compile_pattern = _load_regex_engine(engine)
         self._patterns: dict[str, Pattern[str]] = {}
         for key, pattern in patterns.items():
             normalised = self._normalise_key(key)
             if not normalised:
                 continue
             try:
-                self._patterns[normalised] = re.compile(pattern)
+                self._patterns[normalised] = compile_pattern(pattern)
             except re.error as exc:
                 raise ValueError(f"Invalid scrub pattern for '{key}': {exc}") from exc
         self._replacement = replacement
+        # Raw field name -> pattern (or ``None``); applications reuse a small
+        # vocabulary of keys, so most lookups skip normalisation entirely.
+        self._key_patterns: dict[str, Pattern[str] | None] = {}
 
     def _scrub_dict(self, data: dict[str, Any]) -> tuple[dict[str, Any], bool]:
         """Scrub a dictionary, returning (scrubbed_dict, was_changed).
@@ -76,20 +124,32 @@ class RegexScrubber(ScrubberPort):
         Optimized to delay dictionary copy until first modification is detected,
         avoiding unnecessary allocations for clean data in high-volume logging.
         """
+        if not self._patterns:
+            return data, False
+        key_patterns = self._key_patterns
         result: dict[str, Any] = data  # Start with original reference
         changed = False
         for key, value in data.items():
-            pattern = self._patterns.get(self._normalise_key(key))
+            pattern = cast("Pattern[str] | None", key_patterns.get(key, _UNSEEN))
+            if pattern is _UNSEEN:
+                pattern = self._pattern_for(key)
             if pattern is None:
                 continue
             scrubbed = self._scrub_value(value, pattern)
-            if scrubbed != value:
+            if scrubbed is not value:
                 if not changed:
                     result = dict(data)  # Copy only on first change
                     changed = True
                 result[key] = scrubbed
         return result, changed
 
+    def _pattern_for(self, key: str) -> Pattern[str] | None:
+        """Resolve and memoise the pattern configured for the raw field name ``key``."""
+        pattern = self._patterns.get(self._normalise_key(key))
+        if len(self._key_patterns) < _KEY_CACHE_LIMIT:
+            self._key_patterns[key] = pattern
+        return pattern
+
     def scrub(self, event: LogEvent) -> LogEvent:
         """Return a copy of ``event`` with matching extra fields redacted."""
         extra_copy, extra_changed = self._scrub_dict(event.extra)
@@ -105,10 +165,9 @@ class RegexScrubber(ScrubberPort):
         if not extra_changed and not context_changed:
             return event
 
-        return event.replace(
-            extra=extra_copy if extra_changed else event.extra,
-            context=context,
-        )
+        # ``extra_copy`` is a fresh dict (or the untouched original), so the
+        # validated event can be cloned without re-running its checks.
+        return event.with_payload(extra=extra_copy, context=context)
 
     @staticmethod
     @lru_cache(maxsize=32)
@@ -124,28 +183,53 @@ class RegexScrubber(ScrubberPort):
         text = value.decode("utf-8", errors="ignore")
         return self._replacement if pattern.search(text) else value
 
-    def _scrub_mapping(self, mapping: Mapping[Any, Any], pattern: Pattern[str]) -> dict[Any, Any]:
-        """Recursively scrub mapping values."""
-        result: dict[Any, Any] = {}
+    def _scrub_mapping(self, mapping: Mapping[Any, Any], pattern: Pattern[str]) -> Mapping[Any, Any]:
+        """Recursively scrub mapping values; return ``mapping`` itself when nothing changed."""
+        result: dict[Any, Any] | None = None
         for key, item in mapping.items():
-            result[key] = self._scrub_value(item, pattern)
-        return result
+            scrubbed = self._scrub_value(item, pattern)
+            if result is None:
+                if scrubbed is item:
+                    continue
+                result = dict(mapping)
+            result[key] = scrubbed
+        return mapping if result is None else result
 
     def _scrub_set(self, value: set[Any] | frozenset[Any], pattern: Pattern[str]) -> set[Any] | frozenset[Any]:
-        """Recursively scrub set elements."""
-        scrubbed = {self._scrub_value(item, pattern) for item in value}
+        """Recursively scrub set elements; return ``value`` itself when nothing changed."""
+        scrubbed: set[Any] | None = None
+        for index, item in enumerate(value):
+            cleaned = self._scrub_value(item, pattern)
+            if scrubbed is None:
+                if cleaned is item:
+                    continue
+                # Iteration order is stable, so the first ``index`` elements
+                # are exactly the unchanged ones already visited.
+                scrubbed = set(islice(value, index))
+            scrubbed.add(cleaned)
+        if scrubbed is None:
+            return value
         if isinstance(value, frozenset):
             return frozenset(scrubbed)
         return scrubbed
 
-    def _scrub_sequence(self, value: Sequence[Any], pattern: Pattern[str]) -> list[Any] | tuple[Any, ...]:
-        """Recursively scrub sequence elements."""
-        converted = [self._scrub_value(item, pattern) for item in value]
+    def _scrub_sequence(self, value: Sequence[Any], pattern: Pattern[str]) -> Sequence[Any]:
+        """Recursively scrub sequence elements; return ``value`` itself when nothing changed."""
+        converted: list[Any] | None = None
+        for index, item in enumerate(value):
+            scrubbed = self._scrub_value(item, pattern)
+            if converted is None:
+                if scrubbed is item:
+                    continue
+                converted = list(value)
+            converted[index] = scrubbed
+        if converted is None:
+            return value
         if isinstance(value, tuple):
             return tuple(converted)
         return converted
 
-    def _scrub_value(self, value: Any, pattern: Pattern[str]) -> Any:
+    def _scrub_value(self, value: object, pattern: Pattern[str]) -> Any:
         """Recursively scrub ``value`` using ``pattern``.
 
         Why
@@ -163,9 +247,18 @@ class RegexScrubber(ScrubberPort):
         Outputs
         -------
         Any
-            Original value when it does not match; the replacement token (or
-            structure containing it) when matches are found.
+            The original object (identity preserved) when nothing matches; the
+            replacement token (or a copied structure containing it) otherwise.
         """
+        # Exact built-in types dispatch in one lookup; subclasses (and other
+        # containers) take the isinstance chain in ``_scrub_other``.
+        handler = self._EXACT_TYPE_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(self, value, pattern)
+        return self._scrub_other(value, pattern)
+
+    def _scrub_other(self, value: Any, pattern: Pattern[str]) -> Any:
+        """Scrub ``value`` whose exact type has no entry in ``_EXACT_TYPE_HANDLERS``."""
         if isinstance(value, str):
             return self._scrub_string(value, pattern)
         if isinstance(value, bytes):
@@ -178,5 +271,20 @@ class RegexScrubber(ScrubberPort):
             return self._scrub_sequence(cast("Sequence[Any]", value), pattern)
         return value
 
+    #: Exact built-in types mapped to the (unbound) method that scrubs them.
+    _EXACT_TYPE_HANDLERS: ClassVar[dict[type[Any], Callable[..., Any]]] = {
+        str: _scrub_string,
+        bytes: _scrub_bytes,
+        dict: _scrub_mapping,
+        list: _scrub_sequence,
+        tuple: _scrub_sequence,
+        set: _scrub_set,
+        frozenset: _scrub_set,
+        int: _keep_value,
+        float: _keep_value,
+        bool: _keep_value,
+        type(None): _keep_value,
+    }
+
 
 __all__ = ["RegexScrubber"]
@@ -27,12 +27,12 @@ import socket
 import sys
 import types
 import warnings
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any, Final, cast
 
 from lib_log_rich.adapters._text_utils import strip_emoji
 from lib_log_rich.application.ports.structures import StructuredBackendPort
-from lib_log_rich.domain.levels import LogLevel
+from lib_log_rich.domain.levels import LEVEL_NAMES, LogLevel
 
 if TYPE_CHECKING:
     from lib_log_rich.domain.events import LogEvent
@@ -229,15 +229,12 @@ class JournaldAdapter(StructuredBackendPort):
     def _handle_extra_fields(self, fields: dict[str, Any], extras: Mapping[str, Any]) -> None:
         """Handle EXTRA fields with conflict resolution."""
         for extra_key, extra_value in extras.items():
-            target = self._resolve_field_name(extra_key.upper(), fields)
+            target = extra_key.upper()
+            # Only colliding names need the prefixing rules.
+            if target in _RESERVED_FIELDS or target in fields:
+                target = self._resolve_field_name(target, fields)
             fields[target] = extra_value
 
-    def _handle_process_chain(self, fields: dict[str, Any], value: Any) -> None:
-        """Handle PROCESS_ID_CHAIN field formatting."""
-        chain_parts = self._normalize_chain_value(value)
-        if chain_parts:
-            fields["PROCESS_ID_CHAIN"] = ">".join(chain_parts)
-
     def _resolve_field_name(self, key_upper: str, existing_fields: dict[str, Any]) -> str:
         """Resolve field name avoiding conflicts with reserved fields."""
         target = key_upper if key_upper not in _RESERVED_FIELDS else f"EXTRA_{key_upper}"
@@ -245,14 +242,6 @@ class JournaldAdapter(StructuredBackendPort):
             target = f"EXTRA_{target}"
         return target
 
-    def _normalize_chain_value(self, value: Any) -> list[str]:
-        """Normalize process chain value to list of strings."""
-        if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
-            return [str(part) for part in cast("Iterable[Any]", value)]
-        elif value:
-            return [str(value)]
-        return []
-
     def _build_fields(self, event: LogEvent) -> dict[str, Any]:
         """Construct a journald field dictionary for ``event``.
 
@@ -280,9 +269,9 @@ class JournaldAdapter(StructuredBackendPort):
             "MESSAGE": strip_emoji(event.message),
             "PRIORITY": _LEVEL_MAP[event.level],
             "LOGGER_NAME": event.logger_name,
-            "LOGGER_LEVEL": event.level.severity.upper(),
+            "LOGGER_LEVEL": LEVEL_NAMES[event.level],
             "EVENT_ID": event.event_id,
-            "TIMESTAMP": event.timestamp.isoformat(),
+            "TIMESTAMP": event.timestamp_iso,
         }
 
         # Process context fields directly from dataclass attributes
@@ -298,15 +287,15 @@ class JournaldAdapter(StructuredBackendPort):
         # Handle fields with special logic
         if context.process_id is not None:
             fields["PROCESS_ID"] = context.process_id
-        if context.process_id_chain:
-            self._handle_process_chain(fields, context.process_id_chain)
+        chain = context.process_id_chain
+        if chain:
+            fields["PROCESS_ID_CHAIN"] = ">".join(map(str, chain))
         if context.extra:
             self._handle_extra_fields(fields, context.extra)
 
         # Process extra fields with conflict resolution
-        for key, value in event.extra.items():
-            target = self._resolve_field_name(key.upper(), fields)
-            fields[target] = value
+        if event.extra:
+            self._handle_extra_fields(fields, event.extra)
 
         return fields
 
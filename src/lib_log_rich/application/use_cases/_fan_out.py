@@ -13,7 +13,9 @@ from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
 from lib_log_rich.domain import LogEvent, LogLevel
+from lib_log_rich.domain.levels import LEVEL_NAMES
 
+from ._pipeline import DIAGNOSTIC_DISABLED
 from ._types import ProcessResult
 
 if TYPE_CHECKING:
@@ -26,6 +28,9 @@ if TYPE_CHECKING:
 FanOutCallable = Callable[[LogEvent], list[str]]
 FanOutResultHandler = Callable[[LogEvent], ProcessResult]
 
+#: Threshold no event level reaches; disables a fan-out branch at build time.
+_UNREACHABLE_THRESHOLD = int(LogLevel.CRITICAL) + 1
+
 
 def build_fan_out_handlers(
     *,
@@ -49,42 +54,64 @@ def build_fan_out_handlers(
       expected by ``create_process_log_event``.
     """
 
+    # Resolve thresholds, adapter names, and the backend tuple once; the
+    # closure below runs for every event. Without structured backends their
+    # branch gets an unreachable threshold, so the level comparison alone skips it.
+    console_threshold = int(console_level)
+    console_name = console.__class__.__name__
+    backends = tuple((backend, backend.__class__.__name__) for backend in structured_backends)
+    backend_threshold = int(backend_level) if backends else _UNREACHABLE_THRESHOLD
+    graylog_threshold = int(graylog_level)
+    graylog_name = graylog.__class__.__name__ if graylog is not None else ""
+    diagnostics_enabled = emit is not DIAGNOSTIC_DISABLED
+
+    def _record_failure(event: LogEvent, adapter_name: str, exc: Exception, failed: list[str]) -> None:
+        """Log an adapter failure, add it to ``failed``, and emit ``adapter_error``."""
+        logger.exception(
+            "Adapter %s failed while emitting event %s: %s",
+            adapter_name,
+            event.event_id,
+            exc,
+        )
+        failed.append(adapter_name)
+        emit(
+            "adapter_error",
+            {
+                "adapter": adapter_name,
+                "event_id": event.event_id,
+                "logger": event.logger_name,
+                "level": LEVEL_NAMES[event.level],
+                "error": str(exc),
+            },
+        )
+
+    def _emit_to_backend(backend: StructuredBackendPort, backend_name: str, event: LogEvent, failed: list[str]) -> None:
+        """Emit ``event`` to one structured backend, recording a failure instead of raising."""
+        try:
+            backend.emit(event)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            _record_failure(event, backend_name, exc, failed)
+
     def fan_out(event: LogEvent) -> list[str]:
         """Dispatch event to adapters, returning names of any that failed."""
         failed: list[str] = []
+        level = event.level
+
+        if level >= console_threshold:
+            try:
+                console.emit(event, colorize=colorize_console)
+            except Exception as exc:  # pragma: no cover - defensive guard
+                _record_failure(event, console_name, exc, failed)
 
-        def _safe_emit(callable_: Callable[[], None], adapter_name: str) -> None:
+        if level >= backend_threshold:
+            for backend, backend_name in backends:
+                _emit_to_backend(backend, backend_name, event, failed)
+
+        if graylog is not None and level >= graylog_threshold:
             try:
-                callable_()
+                graylog.emit(event)
             except Exception as exc:  # pragma: no cover - defensive guard
-                logger.exception(
-                    "Adapter %s failed while emitting event %s: %s",
-                    adapter_name,
-                    event.event_id,
-                    exc,
-                )
-                failed.append(adapter_name)
-                emit(
-                    "adapter_error",
-                    {
-                        "adapter": adapter_name,
-                        "event_id": event.event_id,
-                        "logger": event.logger_name,
-                        "level": event.level.name,
-                        "error": str(exc),
-                    },
-                )
-
-        if event.level >= console_level:
-            _safe_emit(lambda: console.emit(event, colorize=colorize_console), console.__class__.__name__)
-
-        if event.level >= backend_level:
-            for backend in structured_backends:
-                _safe_emit(lambda backend=backend: backend.emit(event), backend.__class__.__name__)
-
-        if graylog is not None and event.level >= graylog_level:
-            graylog_adapter = graylog
-            _safe_emit(lambda: graylog_adapter.emit(event), graylog_adapter.__class__.__name__)
+                _record_failure(event, graylog_name, exc, failed)
 
         return failed
 
@@ -97,7 +124,7 @@ def build_fan_out_handlers(
                 {
                     "event_id": event.event_id,
                     "logger": event.logger_name,
-                    "level": event.level.name,
+                    "level": LEVEL_NAMES[event.level],
                     "adapters": failed_adapters,
                 },
             )
@@ -108,14 +135,15 @@ def build_fan_out_handlers(
                 failed_adapters=failed_adapters,
             )
 
-        emit(
-            "emitted",
-            {
-                "event_id": event.event_id,
-                "logger": event.logger_name,
-                "level": event.level.name,
-            },
-        )
+        if diagnostics_enabled:
+            emit(
+                "emitted",
+                {
+                    "event_id": event.event_id,
+                    "logger": event.logger_name,
+                    "level": LEVEL_NAMES[event.level],
+                },
+            )
         return ProcessResult(ok=True, event_id=event.event_id)
 
     return fan_out, finalise
@@ -10,9 +10,10 @@ from lib_log_rich.domain import LogEvent, LogLevel
 from ._types import DiagnosticCallback, DiagnosticPayload
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
+    from datetime import datetime
 
-    from lib_log_rich.application.ports import ClockPort, SystemIdentityPort
+    from lib_log_rich.application.ports import SystemIdentityPort
     from lib_log_rich.domain.context import ContextBinder, LogContext
 
     from ._payload_sanitizer import PayloadSanitizer
@@ -21,13 +22,26 @@ DiagnosticEmitter = DiagnosticCallback
 _MAX_PID_CHAIN = 8
 
 
+def _discard_diagnostic(event_name: str, payload: DiagnosticPayload) -> None:
+    """Drop a diagnostic event; used when no callback is configured."""
+
+
+#: Emitter returned when diagnostics are off. Per-event call sites compare
+#: against it with ``is`` so they can skip building the payload dict.
+DIAGNOSTIC_DISABLED: DiagnosticEmitter = _discard_diagnostic
+
+
 def build_diagnostic_emitter(callback: DiagnosticCallback | None) -> DiagnosticEmitter:
-    """Return a safe diagnostic hook that never interrupts the pipeline."""
+    """Return a safe diagnostic hook that never interrupts the pipeline.
+
+    Without a ``callback`` the shared :data:`DIAGNOSTIC_DISABLED` emitter is
+    returned.
+    """
+    if callback is None:
+        return DIAGNOSTIC_DISABLED
 
     def emit(event_name: str, payload: DiagnosticPayload) -> None:
         """Emit a diagnostic event, suppressing any exceptions."""
-        if callback is None:
-            return
         with suppress(Exception):  # defensive: diagnostics must not raise
             callback(event_name, payload)
 
@@ -120,13 +134,12 @@ def _detect_context_changes(
     new_chain: tuple[int, ...],
 ) -> bool:
     """Detect if any context fields have changed."""
-    return any(
-        [
-            context.process_id != current_pid,
-            context.hostname is None and hostname,
-            context.user_name is None and user_name,
-            new_chain != (context.process_id_chain or ()),
-        ]
+    # Short-circuit on the first difference; this runs for every event.
+    return bool(
+        context.process_id != current_pid
+        or (context.hostname is None and hostname)
+        or (context.user_name is None and user_name)
+        or new_chain != (context.process_id_chain or ())
     )
 
 
@@ -139,6 +152,18 @@ def refresh_context(
     identity_snapshot = identity.resolve_identity()
     current_pid = identity_snapshot.process_id
 
+    # Steady state: the frame was already refreshed in this process, so skip
+    # the chain and change bookkeeping below.
+    chain = context.process_id_chain
+    if (
+        context.process_id == current_pid
+        and chain
+        and chain[-1] == current_pid
+        and (context.hostname is not None or not identity_snapshot.hostname)
+        and (context.user_name is not None or not identity_snapshot.user_name)
+    ):
+        return context
+
     # Resolve identity fields
     hostname, user_name = _resolve_identity_fields(context, identity_snapshot)
 
@@ -176,10 +201,14 @@ def prepare_event(
     context_binder: ContextBinder,
     identity: SystemIdentityPort,
     sanitizer: PayloadSanitizer,
-    clock: ClockPort,
+    now: Callable[[], datetime],
     emit: DiagnosticEmitter,
 ) -> LogEvent:
-    """Build a sanitised :class:`LogEvent` ready for downstream adapters."""
+    """Build a sanitised :class:`LogEvent` ready for downstream adapters.
+
+    ``now`` is the clock's bound ``now`` method, resolved once by the caller
+    rather than looked up on the :class:`ClockPort` for every event.
+    """
     _ = stacklevel  # API parity with logging.Logger; currently unused.
 
     raw_extra = coerce_extra_mapping(extra, event_id=event_id, logger_name=logger_name, emit=emit)
@@ -200,7 +229,7 @@ def prepare_event(
 
     return LogEvent(
         event_id=event_id,
-        timestamp=clock.now(),
+        timestamp=now(),
         logger_name=logger_name,
         level=level,
         message=sanitized_message,
@@ -12,7 +12,9 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from lib_log_rich.domain import LogEvent
+from lib_log_rich.domain.levels import LEVEL_NAMES
 
+from ._pipeline import DIAGNOSTIC_DISABLED
 from ._types import ProcessResult
 
 if TYPE_CHECKING:
@@ -33,6 +35,8 @@ def build_queue_dispatcher(queue: QueuePort | None, emit: DiagnosticEmitter) ->
 
         return _noop
 
+    diagnostics_enabled = emit is not DIAGNOSTIC_DISABLED
+
     def _dispatch(event: LogEvent) -> QueueDispatchResult:
         queued = queue.put(event)
         if not queued:
@@ -41,12 +45,13 @@ def build_queue_dispatcher(queue: QueuePort | None, emit: DiagnosticEmitter) ->
                 {
                     "event_id": event.event_id,
                     "logger": event.logger_name,
-                    "level": event.level.name,
+                    "level": LEVEL_NAMES[event.level],
                 },
             )
             return ProcessResult(ok=False, reason="queue_full")
 
-        emit("queued", {"event_id": event.event_id, "logger": event.logger_name})
+        if diagnostics_enabled:
+            emit("queued", {"event_id": event.event_id, "logger": event.logger_name})
         return ProcessResult(ok=True, event_id=event.event_id, queued=True)
 
     return _dispatch
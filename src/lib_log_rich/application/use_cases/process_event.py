@@ -27,6 +27,14 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from lib_log_rich.domain.levels import LEVEL_NAMES
+
+from ._fan_out import build_fan_out_handlers
+from ._payload_sanitizer import PayloadSanitizer
+from ._pipeline import build_diagnostic_emitter, prepare_event, refresh_context
+from ._queue_dispatch import build_queue_dispatcher
+from ._types import DiagnosticCallback, FanOutCallable, ProcessCallable, ProcessPipelineDependencies, ProcessResult
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
 
@@ -44,12 +52,6 @@ if TYPE_CHECKING:
     # so it is not a real runtime attribute of that module - import it the same way here.
     from ._payload_sanitizer import PayloadLimitsProtocol
 
-from ._fan_out import build_fan_out_handlers
-from ._payload_sanitizer import PayloadSanitizer
-from ._pipeline import build_diagnostic_emitter, prepare_event, refresh_context
-from ._queue_dispatch import build_queue_dispatcher
-from ._types import DiagnosticCallback, FanOutCallable, ProcessCallable, ProcessPipelineDependencies, ProcessResult
-
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +151,21 @@ class _ProcessPipeline(ProcessCallable):
         """Initialize with the pipeline toolkit."""
         self._toolkit = toolkit
         self.fan_out = toolkit.fan_out
+        # Bind the per-event collaborators once; ``__call__`` runs for every
+        # log record and should not chase them through the toolkit.
+        self._scrub = toolkit.scrubber.scrub
+        self._allow = toolkit.rate_limiter.allow
+        self._remember = toolkit.ring_buffer.append
+        self._record = toolkit.severity_monitor.record
+        self._record_drop = toolkit.severity_monitor.record_drop
+        self._queue_dispatch = toolkit.queue_dispatch
+        self._finalize_fan_out = toolkit.finalize_fan_out
+        self._next_id = toolkit.id_provider
+        self._now = toolkit.clock.now
+        self._context_binder = toolkit.context_binder
+        self._identity = toolkit.identity
+        self._sanitizer = toolkit.sanitizer
+        self._emit = toolkit.emit
 
     def __call__(
         self,
@@ -163,8 +180,8 @@ class _ProcessPipeline(ProcessCallable):
         extra: Mapping[str, Any] | None = None,
     ) -> ProcessResult:
         """Process a log event through scrubbing, rate limiting, and fan-out."""
-        event = _craft_event(
-            self._toolkit,
+        event = prepare_event(
+            event_id=self._next_id(),
             logger_name=logger_name,
             level=level,
             message=message,
@@ -173,15 +190,27 @@ class _ProcessPipeline(ProcessCallable):
             stack_info=stack_info,
             stacklevel=stacklevel,
             extra=extra,
+            context_binder=self._context_binder,
+            identity=self._identity,
+            sanitizer=self._sanitizer,
+            now=self._now,
+            emit=self._emit,
         )
-        event = _scrub_event(self._toolkit, event)
-        if not _rate_limiter_allows(self._toolkit, event):
+        event = self._scrub(event)
+        if not self._allow(event):
             return _reject_due_to_rate_limit(self._toolkit, event)
-        _remember_event(self._toolkit, event)
-        queue_answer = _offer_event_to_queue(self._toolkit, event)
-        if queue_answer is not None:
-            return _interpret_queue_outcome(self._toolkit, event, queue_answer)
-        return _fan_out_event(self._toolkit, event)
+        self._remember(event)
+        self._record(event.level)
+
+        outcome = self._queue_dispatch(event)
+        if outcome is None:
+            outcome = self._finalize_fan_out(event)
+            default_reason = "adapter_error"
+        else:
+            default_reason = "queue_failure"
+        if not outcome.ok:
+            self._record_drop(event.level, outcome.reason or default_reason)
+        return outcome
 
 
 def _create_diagnostic_emitter(
@@ -204,83 +233,13 @@ def _create_queue_dispatcher(
     return build_queue_dispatcher(queue, emit)
 
 
-def _craft_event(
-    toolkit: _PipelineToolkit,
-    *,
-    logger_name: str,
-    level: LogLevel,
-    message: object,
-    args: tuple[object, ...],
-    exc_info: object | None,
-    stack_info: object | None,
-    stacklevel: int,
-    extra: Mapping[str, Any] | None,
-) -> LogEvent:
-    event_id = toolkit.id_provider()
-    return prepare_event(
-        event_id=event_id,
-        logger_name=logger_name,
-        level=level,
-        message=message,
-        args=args,
-        exc_info=exc_info,
-        stack_info=stack_info,
-        stacklevel=stacklevel,
-        extra=extra,
-        context_binder=toolkit.context_binder,
-        identity=toolkit.identity,
-        sanitizer=toolkit.sanitizer,
-        clock=toolkit.clock,
-        emit=toolkit.emit,
-    )
-
-
-def _scrub_event(toolkit: _PipelineToolkit, event: LogEvent) -> LogEvent:
-    return toolkit.scrubber.scrub(event)
-
-
-def _rate_limiter_allows(toolkit: _PipelineToolkit, event: LogEvent) -> bool:
-    return toolkit.rate_limiter.allow(event)
-
-
 def _reject_due_to_rate_limit(toolkit: _PipelineToolkit, event: LogEvent) -> ProcessResult:
     toolkit.severity_monitor.record_drop(event.level, "rate_limited")
     toolkit.emit(
         "rate_limited",
-        {"event_id": event.event_id, "logger": event.logger_name, "level": event.level.name},
+        {"event_id": event.event_id, "logger": event.logger_name, "level": LEVEL_NAMES[event.level]},
     )
     return ProcessResult(ok=False, reason="rate_limited", event_id=event.event_id)
 
 
-def _remember_event(toolkit: _PipelineToolkit, event: LogEvent) -> None:
-    toolkit.ring_buffer.append(event)
-    toolkit.severity_monitor.record(event.level)
-
-
-def _offer_event_to_queue(
-    toolkit: _PipelineToolkit,
-    event: LogEvent,
-) -> ProcessResult | None:
-    return toolkit.queue_dispatch(event)
-
-
-def _interpret_queue_outcome(
-    toolkit: _PipelineToolkit,
-    event: LogEvent,
-    queue_answer: ProcessResult,
-) -> ProcessResult:
-    if not queue_answer.ok:
-        reason = queue_answer.reason or "queue_failure"
-        toolkit.severity_monitor.record_drop(event.level, reason)
-    return queue_answer
-
-
-def _fan_out_event(toolkit: _PipelineToolkit, event: LogEvent) -> ProcessResult:
-    outcome = toolkit.finalize_fan_out(event)
-    if not outcome.ok:
-        reason = outcome.reason or "adapter_error"
-        toolkit.severity_monitor.record_drop(event.level, reason)
-    return outcome
-
-
 __all__ = ["create_process_log_event", "refresh_context"]
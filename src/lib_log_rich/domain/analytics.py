@@ -97,13 +97,11 @@ class SeverityMonitor:
         """Initialize the severity monitor with optional thresholds and drop reasons."""
         self._lock = RLock()
         self._highest: LogLevel | None = None
-        self._total_events = 0
         self._level_counts: Counter[LogLevel] = Counter(dict.fromkeys(LogLevel, 0))
         self._thresholds = _normalize_thresholds(thresholds)
-        self._threshold_counts: Counter[LogLevel] = Counter(dict.fromkeys(self._thresholds, 0))
-        self._dropped_total = 0
-        self._drops_by_reason: Counter[str] = self._init_drop_reasons(drop_reasons)
-        self._drops_by_level: Counter[LogLevel] = Counter(dict.fromkeys(LogLevel, 0))
+        # ``record``/``record_drop`` only touch the finest-grained counter;
+        # totals and roll-ups are summed when a snapshot is requested.
+        self._drop_reasons: tuple[str, ...] = tuple(self._init_drop_reasons(drop_reasons))
         self._drops_by_reason_and_level: Counter[tuple[str, LogLevel]] = Counter()
 
     def _init_drop_reasons(self, drop_reasons: Iterable[str] | None) -> Counter[str]:
@@ -125,22 +123,15 @@ class SeverityMonitor:
 
         """
         with self._lock:
-            self._total_events += 1
             self._level_counts[level] += 1
             if self._highest is None or level > self._highest:
                 self._highest = level
-            for threshold in self._thresholds:
-                if level >= threshold:
-                    self._threshold_counts[threshold] += 1
 
     def record_drop(self, level: LogLevel, reason: str) -> None:
         """Register that an event of ``level`` was dropped for ``reason``."""
         canonical = self._normalise_reason(reason)
         with self._lock:
-            self._dropped_total += 1
-            self._drops_by_reason[canonical] += 1
-            self._drops_by_level[level] += 1
-            self._drops_by_reason_and_level[(canonical, level)] += 1
+            self._drops_by_reason_and_level[canonical, level] += 1
 
     def highest(self) -> LogLevel | None:
         """Return the highest severity observed so far."""
@@ -155,27 +146,34 @@ class SeverityMonitor:
     def threshold_counts(self) -> Mapping[LogLevel, int]:
         """Return counts of events meeting configured thresholds."""
         with self._lock:
-            return dict(self._threshold_counts)
+            counts = self._level_counts
+            return {threshold: sum(count for level, count in counts.items() if level >= threshold) for threshold in self._thresholds}
 
     def total_events(self) -> int:
         """Return the total number of recorded events."""
         with self._lock:
-            return self._total_events
+            return sum(self._level_counts.values())
 
     def dropped_total(self) -> int:
         """Return the total number of dropped events."""
         with self._lock:
-            return self._dropped_total
+            return sum(self._drops_by_reason_and_level.values())
 
     def drops_by_reason(self) -> Mapping[str, int]:
         """Return drop counts keyed by drop reason."""
         with self._lock:
-            return dict(self._drops_by_reason)
+            totals = dict.fromkeys(self._drop_reasons, 0)
+            for (reason, _level), count in self._drops_by_reason_and_level.items():
+                totals[reason] = totals.get(reason, 0) + count
+            return totals
 
     def drops_by_level(self) -> Mapping[LogLevel, int]:
         """Return drop counts grouped by severity level."""
         with self._lock:
-            return dict(self._drops_by_level)
+            totals = dict.fromkeys(LogLevel, 0)
+            for (_reason, level), count in self._drops_by_reason_and_level.items():
+                totals[level] += count
+            return totals
 
     def drops_by_reason_and_level(self) -> Mapping[tuple[str, LogLevel], int]:
         """Return drop counts keyed by ``(reason, level)`` tuples."""
@@ -186,12 +184,11 @@ class SeverityMonitor:
         """Clear counters and forget the current peak."""
         with self._lock:
             self._highest = None
-            self._total_events = 0
             self._level_counts = Counter(dict.fromkeys(LogLevel, 0))
-            self._threshold_counts = Counter(dict.fromkeys(self._thresholds, 0))
-            self._dropped_total = 0
-            self._drops_by_reason = Counter(dict.fromkeys(self._drops_by_reason, 0))
-            self._drops_by_level = Counter(dict.fromkeys(LogLevel, 0))
+            # Reasons seen so far keep reporting zero, as before the reset.
+            seen = dict.fromkeys(self._drop_reasons)
+            seen.update(dict.fromkeys(reason for reason, _level in self._drops_by_reason_and_level))
+            self._drop_reasons = tuple(seen)
             self._drops_by_reason_and_level = Counter()
 
     @staticmethod
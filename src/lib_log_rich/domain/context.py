@@ -186,7 +186,7 @@ class LogContext:
             if data["process_id_chain"] is None:
                 data["process_id_chain"] = []
             return data
-        return {key: value for key, value in data.items() if value not in (None, {}, [])}
+        return {key: value for key, value in data.items() if value is not None and not (isinstance(value, (dict, list)) and not value)}
 
     def merge(self, **overrides: Any) -> LogContext:
         """Return a new context with ``overrides`` applied.
@@ -208,10 +208,24 @@ class LogContext:
             (None, 'req-1')
 
         """
-        data = self.to_dict(include_none=True)
-        data.update({k: v for k, v in overrides.items() if v is not None})
-        if overrides.get("extra") is not None:
-            data["extra"] = dict(overrides["extra"])
+        # ``__post_init__`` validates identifiers, copies ``extra`` and
+        # normalises the chain, so hand it the raw fields instead of a
+        # ``to_dict`` round-trip (or the slower generic ``replace``).
+        data: dict[str, Any] = {
+            "service": self.service,
+            "environment": self.environment,
+            "job_id": self.job_id,
+            "request_id": self.request_id,
+            "user_id": self.user_id,
+            "user_name": self.user_name,
+            "hostname": self.hostname,
+            "process_id": self.process_id,
+            "process_id_chain": self.process_id_chain,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "extra": self.extra,
+        }
+        data.update({key: value for key, value in overrides.items() if value is not None})
         return LogContext(**data)
 
     def replace(self, **overrides: Any) -> LogContext:
@@ -115,6 +115,7 @@ class LogEvent:
     extra: dict[str, Any] = field(default_factory=_new_extra_mapping)
     exc_info: str | None = None
     stack_info: str | None = None
+    _timestamp_iso: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Normalise timestamp and protect against accidental mutation.
@@ -129,6 +130,29 @@ class LogEvent:
             raise ValueError("event_id must not be empty")
         object.__setattr__(self, "extra", dict(self.extra))
 
+    @property
+    def timestamp_iso(self) -> str:
+        """Return ``timestamp.isoformat()``, formatted at most once per event.
+
+        Every sink receives the same event object, so the first one to ask
+        pays for ``isoformat`` and the rest reuse its string.
+
+        Example:
+            >>> from datetime import timezone
+            >>> ctx = LogContext(service='svc', environment='prod', job_id='job')
+            >>> event = LogEvent('abc', datetime(2025, 9, 30, 12, 0, tzinfo=timezone.utc), 'svc', LogLevel.INFO, 'ok', ctx)
+            >>> event.timestamp_iso
+            '2025-09-30T12:00:00+00:00'
+            >>> event.timestamp_iso is event.timestamp_iso
+            True
+
+        """
+        iso = self._timestamp_iso
+        if iso is None:
+            iso = self.timestamp.isoformat()
+            object.__setattr__(self, "_timestamp_iso", iso)
+        return iso
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize the event to a dictionary with ISO8601 timestamps.
 
@@ -153,7 +177,7 @@ class LogEvent:
         """
         data = {
             "event_id": self.event_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "logger_name": self.logger_name,
             "level": self.level.severity,
             "message": self.message,
@@ -255,5 +279,36 @@ class LogEvent:
         """
         return replace(self, **changes)
 
+    def with_payload(self, *, extra: dict[str, Any], context: LogContext) -> LogEvent:
+        """Return a copy of the event carrying ``extra`` and ``context``.
+
+        Unlike :meth:`replace` this skips ``__post_init__``: every other field
+        was validated when ``self`` was built, and ``extra`` is adopted as-is
+        rather than copied, so callers must hand over a dict nobody else
+        mutates. Used on hot paths such as scrubbing.
+
+        Example:
+            >>> from datetime import timezone
+            >>> ctx = LogContext(service='svc', environment='prod', job_id='job')
+            >>> event = LogEvent('abc', datetime(2025, 9, 30, 12, 0, tzinfo=timezone.utc), 'svc', LogLevel.INFO, 'ok', ctx, extra={'k': 'v'})
+            >>> copy = event.with_payload(extra={'k': '***'}, context=ctx)
+            >>> (copy.extra, copy.message, event.extra)
+            ({'k': '***'}, 'ok', {'k': 'v'})
+
+        """
+        clone = object.__new__(LogEvent)
+        set_field = object.__setattr__
+        set_field(clone, "event_id", self.event_id)
+        set_field(clone, "timestamp", self.timestamp)
+        set_field(clone, "logger_name", self.logger_name)
+        set_field(clone, "level", self.level)
+        set_field(clone, "message", self.message)
+        set_field(clone, "context", context)
+        set_field(clone, "extra", extra)
+        set_field(clone, "exc_info", self.exc_info)
+        set_field(clone, "stack_info", self.stack_info)
+        set_field(clone, "_timestamp_iso", self._timestamp_iso)
+        return clone
+
 
 __all__ = ["LogEvent"]
@@ -10,6 +10,7 @@ Contents
 * :class:`LogLevel` enum with conversion helpers and presentation metadata.
 * ``_ICON_TABLE`` constant mapping levels to console glyphs.
 * ``_CODE_TABLE`` constant providing four-character formatter abbreviations.
+* :data:`LEVEL_NAMES` constant mapping levels to their member names.
 
 System Role
 -----------
@@ -206,4 +207,9 @@ _CODE_TABLE = {
 # Four-character abbreviations for formatter strings and column layouts.
 
 
-__all__ = ["LogLevel"]
+LEVEL_NAMES: dict[LogLevel, str] = {level: level.name for level in LogLevel}
+# Member names ("INFO"...) for diagnostics and payloads; a dict lookup
+# avoids the enum name descriptor, which costs several times more per event.
+
+
+__all__ = ["LEVEL_NAMES", "LogLevel"]
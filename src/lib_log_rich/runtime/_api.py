@@ -9,8 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import io
-from contextlib import contextmanager, redirect_stdout
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from types import MappingProxyType
@@ -28,7 +27,7 @@ from ._state import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Mapping
 
     from lib_log_rich.adapters import QueueAdapter
     from lib_log_rich.domain.dump_filter import FilterSpecValue
@@ -431,15 +430,7 @@ def summary_info() -> str:
     """Return the metadata banner used by the CLI entry point and docs."""
     from .. import __init__conf__  # noqa: PLC0415 - avoids importing the package __init__conf__ during runtime package init
 
-    return _capture_stdout(__init__conf__.print_info)
-
-
-def _capture_stdout(printer: Callable[[], None]) -> str:
-    """Capture stdout produced by ``printer`` and return it as text."""
-    buffer = io.StringIO()
-    with redirect_stdout(buffer):
-        printer()
-    return buffer.getvalue()
+    return __init__conf__.info_text()
 
 
 __all__ = [
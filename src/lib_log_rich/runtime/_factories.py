@@ -112,7 +112,8 @@ class SystemIdentityProvider(SystemIdentityPort):
         """Return the current system identity snapshot.
 
         Note: Identity is cached for the process lifetime since user, hostname,
-        and process ID don't change during execution.
+        and process ID don't change during execution. Forked children drop
+        the cached process ID, so they report their own.
         """
         return _cached_system_identity()
 
@@ -167,6 +168,18 @@ def _cached_process_id() -> int:
     return os.getpid() if os is not None else 0  # pragma: no cover - fallback for runtimes without os
 
 
+def _forget_process_id() -> None:
+    """Drop the cached process ID in a forked child; user and host carry over."""
+    _cached_system_identity.cache_clear()
+    _cached_process_id.cache_clear()
+
+
+# A forked child inherits the parent's caches; refresh the PID so
+# ``refresh_context`` extends the process chain with the child's own ID.
+if os is not None and hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_process_id)
+
+
 def clear_identity_cache() -> None:
     """Clear cached identity values. Used for testing."""
     _cached_system_identity.cache_clear()
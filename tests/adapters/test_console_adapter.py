@@ -71,6 +71,11 @@ def test_console_styles_can_be_repainted_with_magenta_whispers() -> None:
     assert "\x1b[35m" in rainbow
 
 
+def test_console_style_overrides_reject_unknown_levels() -> None:
+    with pytest.raises(ValueError, match="Unknown log level"):
+        _make_adapter(styles={"LOUD": "magenta"})
+
+
 def test_console_switches_off_colour_when_no_colour_is_requested() -> None:
     adapter, console = _make_adapter(no_color=True)
     adapter.emit(_make_event(), colorize=True)
@@ -141,16 +146,10 @@ def test_console_falls_back_to_full_template_when_custom_placeholders_break() ->
 
 
 def test_console_raise_when_full_template_itself_shatters(monkeypatch: pytest.MonkeyPatch) -> None:
-    class BrokenPayload:
-        """Mock payload that returns incomplete dict from to_dict()."""
-
-        def to_dict(self) -> dict[str, object]:
-            return {"message": "only"}
-
-    def broken_payload(_: LogEvent) -> BrokenPayload:
-        return BrokenPayload()
+    def broken_payload(_: LogEvent) -> dict[str, object]:
+        return {"message": "only"}
 
-    monkeypatch.setattr(console_module, "build_format_payload", broken_payload)
+    monkeypatch.setattr(console_module, "FormatPayloadView", broken_payload)
     adapter = RichConsoleAdapter(format_preset="full")
     with pytest.raises(KeyError):
         adapter.emit(_make_event(), colorize=False)
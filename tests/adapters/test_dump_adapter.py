@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import IO, TYPE_CHECKING, Any, cast
 
 import pytest
 
@@ -17,6 +17,8 @@ from lib_log_rich.domain.ring_buffer import RingBuffer
 from tests.os_markers import OS_AGNOSTIC
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from lib_log_rich.domain.dump_filter import DumpFilter
 
 pytestmark = [OS_AGNOSTIC]
@@ -136,6 +138,13 @@ def test_json_dump_enriches_level_metadata() -> None:
     assert data["context"]["process_id_chain"] == [5, 10]
 
 
+def test_json_dump_keeps_each_event_on_its_own_context() -> None:
+    shared = build_event(0)
+    events = [shared, build_event(1), shared.replace(event_id="evt-2")]
+    data = json.loads(render_dump(events, dump_format=DumpFormat.JSON))
+    assert [entry["context"]["process_id"] for entry in data] == [10, 11, 10]
+
+
 def test_html_table_dump_returns_html_string(tmp_path: Path) -> None:
     target = tmp_path / "dump.html"
     payload = render_dump(build_ring_buffer().snapshot(), dump_format=DumpFormat.HTML_TABLE, path=target)
@@ -148,6 +157,13 @@ def test_html_table_dump_writes_target_file(tmp_path: Path) -> None:
     assert target.exists()
 
 
+def test_dump_written_in_slices_matches_returned_payload(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dump_module, "_WRITE_CHUNK_CHARS", 7)
+    target = tmp_path / "nested" / "dump.txt"
+    payload = render_dump([build_event(0, message="größe ✓"), build_event(1)], dump_format=DumpFormat.TEXT, path=target)
+    assert target.read_text(encoding="utf-8") == payload
+
+
 def test_html_table_dump_includes_pid_chain(tmp_path: Path) -> None:
     target = tmp_path / "dump.html"
     render_dump(build_ring_buffer().snapshot(), dump_format=DumpFormat.HTML_TABLE, path=target)
@@ -162,6 +178,12 @@ def test_html_table_dump_escapes_greater_than(tmp_path: Path) -> None:
     assert "5&gt;10" in html_text
 
 
+def test_html_table_dump_escapes_free_text_cells() -> None:
+    event = build_event(level=LogLevel.WARNING, message="<b>bold</b> & 'quoted'")
+    html_text = render_dump([event], dump_format=DumpFormat.HTML_TABLE)
+    assert "<td>WARNING</td><td>tests</td><td>&lt;b&gt;bold&lt;/b&gt; &amp; &#x27;quoted&#x27;</td>" in html_text
+
+
 def test_html_txt_dump_colorizes_with_theme() -> None:
     payload = render_dump([build_event()], dump_format=DumpFormat.HTML_TXT, format_template="{message}", colorize=True, theme="classic")
     assert "<span" in payload
@@ -172,6 +194,14 @@ def test_html_txt_dump_includes_message_when_colorized() -> None:
     assert "message-0" in payload
 
 
+def test_html_txt_dump_styles_each_line_separately() -> None:
+    events = [build_event(0, level=LogLevel.INFO), build_event(1, level=LogLevel.ERROR)]
+    payload = render_dump(events, dump_format=DumpFormat.HTML_TXT, format_template="{message}", colorize=True, theme="classic")
+    info_at, error_at = payload.index("message-0"), payload.index("message-1")
+    assert info_at < error_at
+    assert payload.count("<span") == 2
+
+
 def test_html_txt_dump_respects_monochrome() -> None:
     payload = render_dump([build_event()], dump_format=DumpFormat.HTML_TXT, format_template="{message}", colorize=False)
     assert "<span" not in payload
@@ -207,6 +237,18 @@ def test_unknown_text_preset_raises_value_error() -> None:
         cast("Any", dump_module)._resolve_preset("unknown")
 
 
+@pytest.mark.parametrize(
+    ("template", "message"),
+    [
+        pytest.param("{missing}", "Unknown placeholder", id="unknown-placeholder"),
+        pytest.param("{message} }", "Invalid format specification", id="malformed"),
+    ],
+)
+def test_text_dump_reports_broken_templates(template: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        render_dump([build_event()], dump_format=DumpFormat.TEXT, format_template=template)
+
+
 def test_render_text_returns_empty_string_for_no_events() -> None:
     assert cast("Any", DumpAdapter)._render_text([], template=None, colorize=False) == ""
 
@@ -217,6 +259,15 @@ def test_render_text_uses_theme_styles_when_colorized() -> None:
     assert "message-0" in payload
 
 
+@pytest.fixture
+def fresh_style_wrappers() -> Iterator[None]:
+    style_wrapper = cast("Any", dump_module)._style_wrapper
+    style_wrapper.cache_clear()
+    yield
+    style_wrapper.cache_clear()
+
+
+@pytest.mark.usefixtures("fresh_style_wrappers")
 def test_render_text_handles_missing_marker(monkeypatch: pytest.MonkeyPatch) -> None:
     event = build_event()
 
@@ -250,17 +301,17 @@ def test_render_html_text_returns_minimal_document_when_no_events() -> None:
     assert cast("Any", DumpAdapter)._render_html_text([], template=None, colorize=False) == expected_html
 
 
-def test_render_html_table_handles_string_process_chain() -> None:
+def test_render_html_table_escapes_process_chain_separator() -> None:
     event = build_event(extra={})
 
     class CustomContext:
-        """Mock context with string process_id_chain for testing HTML escaping."""
+        """Mock context with a multi-segment process_id_chain for testing HTML escaping."""
 
         service = "svc"
         environment = "test"
         job_id = "job"
         process_id = 1
-        process_id_chain = "root>child"
+        process_id_chain: tuple[int, ...] = (10, 20)
         user_name = None
         hostname = None
         request_id = None
@@ -282,7 +333,7 @@ def test_render_html_table_handles_string_process_chain() -> None:
 
     object.__setattr__(event, "context", CustomContext())
     html_table = cast("Any", DumpAdapter)._render_html_table([event])
-    assert "root&gt;child" in html_table
+    assert "<td>10&gt;20</td>" in html_table
 
 
 def test_render_html_table_handles_missing_process_chain() -> None:
@@ -343,6 +394,20 @@ def test_text_dump_uses_theme_from_event_extra() -> None:
     assert "\x1b[32m" not in payload
 
 
+def test_text_dump_styles_each_line_by_its_own_level_and_theme() -> None:
+    events = [
+        build_event(0, level=LogLevel.INFO),
+        build_event(1, level=LogLevel.INFO, extra={"theme": "classic"}),
+        build_event(2, level=LogLevel.ERROR),
+        build_event(3, level=LogLevel.INFO),
+    ]
+    lines = render_dump(events, dump_format=DumpFormat.TEXT, format_template="{message}", colorize=True).splitlines()
+    assert lines[0] == "\x1b[32mmessage-0\x1b[0m"
+    assert lines[3] == "\x1b[32mmessage-3\x1b[0m"
+    assert lines[1].startswith("\x1b[36m")
+    assert lines[2].startswith("\x1b[31m")
+
+
 def test_html_text_dump_uses_console_styles() -> None:
     event = build_event(level=LogLevel.ERROR)
     payload = render_dump(
@@ -369,20 +434,13 @@ def test_dump_creates_parent_directories(tmp_path: Path) -> None:
 
 def test_dump_propagates_write_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     target = tmp_path / "dump.txt"
-    original_write_text = Path.write_text
-
-    def failing_write(
-        self: Path,
-        data: str,
-        *,
-        encoding: str = "utf-8",
-        errors: str | None = None,
-        newline: str | None = None,
-    ) -> int:
+    original_open = cast("Callable[..., IO[Any]]", Path.open)
+
+    def failing_open(self: Path, *args: Any, **kwargs: Any) -> IO[Any]:
         if self == target:
             raise OSError("disk full")
-        return original_write_text(self, data, encoding=encoding, errors=errors, newline=newline)
+        return original_open(self, *args, **kwargs)
 
-    monkeypatch.setattr(Path, "write_text", failing_write)
+    monkeypatch.setattr(Path, "open", failing_open)
     with pytest.raises(OSError, match="disk full"):
         render_dump(build_ring_buffer().snapshot(), dump_format=DumpFormat.TEXT, path=target)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime, timezone
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
 
 import pytest
 
-from lib_log_rich.adapters._formatting import FormatPayload, build_format_payload
+from lib_log_rich.adapters import _formatting as formatting_module
+from lib_log_rich.adapters._formatting import FormatPayload, FormatPayloadView, build_format_payload, compile_template
 from lib_log_rich.domain.context import LogContext
 from lib_log_rich.domain.events import LogEvent
 from lib_log_rich.domain.levels import LogLevel
@@ -18,7 +19,7 @@ EventFactory = Callable[[dict[str, Any] | None], LogEvent]
 
 
 @pytest.fixture
-def formatted_event(event_factory: EventFactory) -> FormatPayload:
+def rich_event(event_factory: EventFactory) -> LogEvent:
     """Provide an event tuned to exercise every formatting branch."""
     context = LogContext(
         service="svc",
@@ -30,7 +31,7 @@ def formatted_event(event_factory: EventFactory) -> FormatPayload:
         process_id_chain=(123, 456, 777),
     )
     extra = {"theme": "dawn", "custom": "glow"}
-    base: LogEvent = event_factory(
+    return event_factory(
         {
             "context": context,
             "extra": extra,
@@ -39,7 +40,12 @@ def formatted_event(event_factory: EventFactory) -> FormatPayload:
             "message": "lantern",
         }
     )
-    return build_format_payload(base)
+
+
+@pytest.fixture
+def formatted_event(rich_event: LogEvent) -> FormatPayload:
+    """Provide the eager payload built from :func:`rich_event`."""
+    return build_format_payload(rich_event)
 
 
 @pytest.mark.parametrize(
@@ -107,6 +113,23 @@ def test_the_payload_rescues_context_fields(formatted_event: FormatPayload) -> N
     )
 
 
+def test_the_payload_sorts_context_fields_without_extras(rich_event: LogEvent) -> None:
+    """Events without extras keep the same key order as the merged path."""
+    payload = build_format_payload(rich_event.replace(extra={}))
+    assert (
+        payload.context_fields == " environment=prod hostname=orchestra job_id=job-7 process_id=777 process_id_chain=(123, 456, 777) service=svc user_name=bard"
+    )
+
+
+def test_the_payload_skips_empty_extra_values(rich_event: LogEvent) -> None:
+    """Extras holding ``None`` or an empty mapping stay out of context_fields."""
+    payload = build_format_payload(rich_event.replace(extra={"gone": None, "hollow": {}, "zero": 0, "blank": ""}))
+    assert "gone=" not in payload.context_fields
+    assert "hollow=" not in payload.context_fields
+    assert "zero=0" in payload.context_fields
+    assert "blank=" in payload.context_fields
+
+
 def test_the_payload_announces_process_chain(formatted_event: FormatPayload) -> None:
     """Process chains arrive already braided."""
     assert formatted_event.process_id_chain == "123>456>777"
@@ -117,3 +140,71 @@ def test_the_payload_remembers_local_time(formatted_event: FormatPayload) -> Non
     utc_stamp = datetime(2025, 10, 13, 14, 15, 16, tzinfo=timezone.utc)
     local_expected = utc_stamp.astimezone().replace(microsecond=0)
     assert formatted_event.timestamps.timestamp_trimmed_naive_loc == local_expected.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def test_the_payload_splits_date_parts(formatted_event: FormatPayload) -> None:
+    """Date placeholders carry zero-padded slices of the trimmed timestamp."""
+    stamps = formatted_event.timestamps
+    assert (stamps.YYYY, stamps.MM, stamps.DD, stamps.hh, stamps.mm, stamps.ss) == ("2025", "10", "13", "14", "15", "16")
+    assert stamps.timestamp_trimmed_naive == "2025-10-13T14:15:16"
+
+
+def test_the_payload_view_mirrors_to_dict(rich_event: LogEvent, formatted_event: FormatPayload) -> None:
+    """The lazy mapping view exposes exactly the to_dict() placeholders."""
+    assert dict(FormatPayloadView(rich_event)) == formatted_event.to_dict()
+
+
+def test_the_payload_view_rejects_unknown_placeholders(rich_event: LogEvent) -> None:
+    """Unknown placeholders surface as KeyError, just like a plain dict."""
+    with pytest.raises(KeyError):
+        "{missing}".format_map(FormatPayloadView(rich_event))
+
+
+def test_the_payload_view_skips_timestamps_for_message_only_templates(rich_event: LogEvent) -> None:
+    """Templates that never mention a clock field never build the timestamp variants."""
+    view = FormatPayloadView(rich_event)
+    assert compile_template("{LEVEL} {message}")(view) == "WARNING lantern"
+    assert (cast("Any", view)._utc, cast("Any", view)._local) == (None, None)
+
+
+def test_the_payload_view_leaves_local_time_alone_for_utc_templates(rich_event: LogEvent) -> None:
+    """UTC clock placeholders never convert the stamp to local time."""
+    view = FormatPayloadView(rich_event)
+    assert compile_template("{hh}:{mm}:{ss}")(view) == "14:15:16"
+    assert cast("Any", view)._local is None
+
+
+@pytest.mark.parametrize(
+    "stamp",
+    [
+        pytest.param(datetime(2025, 10, 13, 14, 15, 16, 789123, tzinfo=timezone.utc), id="microseconds"),
+        pytest.param(datetime(2025, 10, 13, 14, 15, 16, tzinfo=timezone.utc), id="whole-second"),
+        pytest.param(datetime(2025, 10, 13, 14, 15, 16, 5, tzinfo=timezone(timedelta(hours=-3, minutes=-30))), id="negative-offset"),
+    ],
+)
+def test_the_payload_trims_like_replacing_microseconds(stamp: datetime) -> None:
+    """Slicing the ISO string matches dropping microseconds before formatting."""
+    _, trimmed, trimmed_naive, *_ = cast("Any", formatting_module)._timestamp_variants(stamp, stamp.isoformat())
+    assert trimmed == stamp.replace(microsecond=0).isoformat()
+    assert trimmed_naive == stamp.replace(microsecond=0, tzinfo=None).isoformat()
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        pytest.param("{timestamp} {LEVEL:<8} {logger_name} {event_id} {message}{context_fields}", id="full-preset"),
+        pytest.param("{{literal}} {message!r} {process_id:>6}", id="escapes-conversion-spec"),
+        pytest.param("{context[service]} {level_enum.name}", id="index-and-attribute-fallback"),
+        pytest.param("{message:>{process_id}}", id="nested-spec-fallback"),
+    ],
+)
+def test_compiled_templates_render_like_format_map(rich_event: LogEvent, template: str) -> None:
+    """Pre-parsed templates render exactly what str.format_map would."""
+    view = FormatPayloadView(rich_event)
+    assert compile_template(template)(view) == template.format_map(view)
+
+
+def test_compiled_templates_reject_malformed_patterns() -> None:
+    """Malformed templates still surface str.format's ValueError."""
+    with pytest.raises(ValueError, match="Single"):
+        compile_template("{message} }")
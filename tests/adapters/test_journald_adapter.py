@@ -5,6 +5,7 @@ import socket
 import sys
 import threading
 import time
+from datetime import timedelta
 from types import ModuleType, SimpleNamespace
 from typing import TYPE_CHECKING, TypeAlias, cast
 
@@ -67,6 +68,31 @@ def test_adapter_whispers_structured_fields_via_public_emit(event_factory: Calla
     assert payload["SERVICE"] == "svc"
 
 
+@pytest.mark.parametrize("level", list(LogLevel))
+def test_adapter_names_the_level_in_upper_case(level: LogLevel, event_factory: Callable[[dict[str, object] | None], LogEvent]) -> None:
+    recorded: Recorder = []
+
+    def capture(**payload: object) -> None:
+        recorded.append(dict(payload))
+
+    JournaldAdapter(sender=capture).emit(_make_event(event_factory).replace(level=level))
+    assert recorded.pop()["LOGGER_LEVEL"] == level.severity.upper()
+
+
+def test_adapter_stamps_each_event_with_its_own_timestamp(event_factory: Callable[[dict[str, object] | None], LogEvent]) -> None:
+    recorded: Recorder = []
+
+    def capture(**payload: object) -> None:
+        recorded.append(dict(payload))
+
+    adapter = JournaldAdapter(sender=capture)
+    first = _make_event(event_factory)
+    later = first.replace(timestamp=first.timestamp + timedelta(seconds=1))
+    for event in (first, later, first):
+        adapter.emit(event)
+    assert [payload["TIMESTAMP"] for payload in recorded] == [first.timestamp.isoformat(), later.timestamp.isoformat(), first.timestamp.isoformat()]
+
+
 @POSIX_ONLY
 def test_adapter_braids_process_chain_when_context_offers_iterable(event_factory: Callable[[dict[str, object] | None], LogEvent]) -> None:
     recorded: Recorder = []
@@ -9,10 +9,12 @@ from typing import Any
 
 import pytest
 
+from lib_log_rich.adapters import _queue_worker as queue_worker_module
 from lib_log_rich.adapters._queue_worker import QueueWorkerState
 from lib_log_rich.application.use_cases._types import DiagnosticPayload
 from lib_log_rich.domain.enums import QueuePolicy
 from lib_log_rich.domain.events import LogEvent
+from lib_log_rich.domain.levels import LogLevel
 from tests.os_markers import OS_AGNOSTIC, POSIX_ONLY
 
 pytestmark = [OS_AGNOSTIC]
@@ -31,6 +33,8 @@ def make_state(
     stop_timeout: float | None = 0.1,
     failure_reset_after: float | None = 0.05,
     diagnostics: Diagnostics | None = None,
+    soft_limit: float | None = None,
+    codel_target: float | None = None,
 ) -> QueueWorkerState:
     records = diagnostics if diagnostics is not None else None
 
@@ -47,6 +51,8 @@ def make_state(
         stop_timeout=stop_timeout,
         diagnostic=record if diagnostics is not None else None,
         failure_reset_after=failure_reset_after,
+        soft_limit=soft_limit,
+        codel_target=codel_target,
     )
 
 
@@ -377,7 +383,7 @@ def test_queue_worker_enqueue_stop_signal_handles_empty_queue(monkeypatch: pytes
     original_get_nowait = state._queue.get_nowait  # type: ignore[attr-defined]
     attempts = {"count": 0}
 
-    def fake_get_nowait() -> LogEvent | None:  # type: ignore[override]
+    def fake_get_nowait() -> LogEvent | queue_worker_module._Stamped | None:  # type: ignore[override]
         if attempts["count"] == 0:
             attempts["count"] += 1
             raise queue.Empty
@@ -439,3 +445,216 @@ def test_queue_worker_enqueue_stop_signal_ignores_none_payload() -> None:
     state = make_state(worker=None, drop_policy=QueuePolicy.DROP)
     state.enqueue_raw(None)
     state.enqueue_stop_signal(deadline=time.monotonic())
+
+
+def test_queue_worker_batches_keep_event_order(event_factory: EventFactory) -> None:
+    """Events taken in batches are still processed in enqueue order."""
+    seen: list[str] = []
+    state = make_state(worker=lambda event: seen.append(event.event_id), maxsize=256)
+    events = [event_factory({"event_id": f"evt-{index}"}) for index in range(200)]
+    for event in events:
+        state.enqueue_raw(event)
+    state.start()
+    assert state.wait_until_idle(1.0)
+    state.stop(timeout=1.0)
+    assert seen == [event.event_id for event in events]
+
+
+def test_queue_worker_leaves_items_behind_stop_signal_queued(event_factory: EventFactory) -> None:
+    """Items queued behind the stop signal stay queued for shutdown handling."""
+    seen: list[LogEvent] = []
+    state = make_state(worker=seen.append, maxsize=4)
+    first, later = event_factory({"event_id": "first"}), event_factory({"event_id": "later"})
+    state.enqueue_raw(first)
+    state.enqueue_raw(None)
+    state.enqueue_raw(later)
+    state._stop_event.set()  # type: ignore[attr-defined]
+    state._run()  # type: ignore[attr-defined]
+    assert seen == [first]
+    assert state.queue_size() == 1
+
+
+def test_queue_worker_stays_within_capacity_when_producers_refill_before_the_stop_signal(event_factory: EventFactory) -> None:
+    """Producers filling the queue while a batch runs cannot push it past ``maxsize``."""
+    state = make_state(worker=None, maxsize=4, drop_policy=QueuePolicy.DROP)
+    first, later = event_factory({"event_id": "first"}), event_factory({"event_id": "later"})
+
+    def refill_on_first(event: LogEvent) -> None:
+        if event is first:
+            state._stop_event.set()  # type: ignore[attr-defined]
+            while state.put(event_factory({"event_id": "refill"})):
+                pass
+
+    state.set_worker(refill_on_first)
+    state.enqueue_raw(first)
+    state.enqueue_raw(None)
+    state.enqueue_raw(later)
+    state._run()  # type: ignore[attr-defined]
+
+    assert state.queue_size() == 4
+    assert state._queue.get_nowait() is later  # type: ignore[attr-defined]
+
+
+def _fill_to_soft_pressure(state: QueueWorkerState, event_factory: EventFactory, depth: int) -> None:
+    for index in range(depth):
+        state.enqueue_raw(event_factory({"event_id": f"backlog-{index}"}))
+
+
+def test_queue_worker_sheds_info_events_past_the_soft_limit(event_factory: EventFactory) -> None:
+    """Past the soft limit, low-severity events are dropped before the hard cap."""
+    diagnostics: Diagnostics = []
+    state = make_state(worker=None, maxsize=4, diagnostics=diagnostics, soft_limit=0.5)
+    _fill_to_soft_pressure(state, event_factory, 4)
+
+    assert state.put(event_factory({"event_id": "chatty", "level": LogLevel.INFO})) is False
+    assert [name for name, _ in diagnostics] == ["queue_dropped"]
+    payload = diagnostics[0][1]
+    assert payload["reason"] == "soft_backpressure"
+    assert payload["load"] == 1.0
+    assert payload["qsize"] == 4
+
+
+def test_queue_worker_keeps_warnings_past_the_soft_limit(event_factory: EventFactory) -> None:
+    """Warnings and above are never shed by the soft limit."""
+    state = make_state(worker=None, maxsize=4, soft_limit=0.5)
+    _fill_to_soft_pressure(state, event_factory, 3)
+
+    assert state.put(event_factory({"event_id": "alarm", "level": LogLevel.WARNING})) is True
+    assert state.queue_size() == 4
+
+
+def test_queue_worker_soft_limit_sheds_a_load_proportional_share(event_factory: EventFactory) -> None:
+    """Below capacity the shed share accumulates, so some events still get through."""
+    state = make_state(worker=None, maxsize=8, soft_limit=0.5)
+    _fill_to_soft_pressure(state, event_factory, 6)
+
+    outcomes = [state.put(event_factory({"event_id": f"quiet-{index}", "level": LogLevel.DEBUG})) for index in range(2)]
+
+    assert outcomes == [True, False]
+    assert state.queue_size() == 7
+
+
+@pytest.mark.parametrize(("soft_limit", "maxsize"), [(0.0, 4), (1.0, 4), (0.5, 0)])
+def test_queue_worker_rejects_unusable_soft_limits(soft_limit: float, maxsize: int) -> None:
+    """Soft limits need a fraction strictly inside (0, 1) and a bounded queue."""
+    with pytest.raises(ValueError, match="soft_limit"):
+        make_state(worker=None, maxsize=maxsize, soft_limit=soft_limit)
+
+
+class _Clock:
+    """Manually advanced stand-in for the worker module's ``time``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _dequeue_at(state: QueueWorkerState, clock: _Clock, now: float) -> None:
+    clock.now = now
+    item = state._queue.get_nowait()  # type: ignore[attr-defined]
+    state._handle_queue_item(item, state.current_worker())  # type: ignore[attr-defined]
+
+
+def _codel_state(monkeypatch: pytest.MonkeyPatch, processed: list[str], diagnostics: Diagnostics) -> tuple[QueueWorkerState, _Clock]:
+    clock = _Clock()
+    monkeypatch.setattr("lib_log_rich.adapters._queue_worker.time", clock)
+    state = make_state(
+        worker=lambda event: processed.append(event.event_id),
+        maxsize=16,
+        drop_policy=QueuePolicy.DROP,
+        diagnostics=diagnostics,
+        codel_target=0.005,
+    )
+    return state, clock
+
+
+def test_queue_worker_codel_drops_stale_events_at_a_rising_rate(monkeypatch: pytest.MonkeyPatch, event_factory: EventFactory) -> None:
+    """Events stuck above the target for a full interval are dropped, spaced by the control law."""
+    processed: list[str] = []
+    diagnostics: Diagnostics = []
+    state, clock = _codel_state(monkeypatch, processed, diagnostics)
+    for index in range(4):
+        assert state.put(event_factory({"event_id": f"stale-{index}"}))
+
+    for now in (1.0, 1.2, 1.25, 1.3):
+        _dequeue_at(state, clock, now)
+
+    assert processed == ["stale-0", "stale-2"]
+    codel_drops = [payload for name, payload in diagnostics if name == "queue_codel_drop"]
+    assert [payload["event_id"] for payload in codel_drops] == ["stale-1", "stale-3"]
+    assert [payload["drop_count"] for payload in codel_drops] == [1, 2]
+
+
+def test_queue_worker_codel_spares_warnings(monkeypatch: pytest.MonkeyPatch, event_factory: EventFactory) -> None:
+    """Warnings are delivered however long they waited."""
+    processed: list[str] = []
+    state, clock = _codel_state(monkeypatch, processed, [])
+    for index in range(3):
+        state.put(event_factory({"event_id": f"warn-{index}", "level": LogLevel.WARNING}))
+
+    for now in (1.0, 1.2, 1.4):
+        _dequeue_at(state, clock, now)
+
+    assert processed == ["warn-0", "warn-1", "warn-2"]
+
+
+def test_queue_worker_codel_stops_dropping_once_delay_recovers(monkeypatch: pytest.MonkeyPatch, event_factory: EventFactory) -> None:
+    """A fresh event ends the dropping state."""
+    processed: list[str] = []
+    state, clock = _codel_state(monkeypatch, processed, [])
+    for index in range(2):
+        state.put(event_factory({"event_id": f"stale-{index}"}))
+    _dequeue_at(state, clock, 1.0)
+    _dequeue_at(state, clock, 1.2)
+
+    clock.now = 2.0
+    state.put(event_factory({"event_id": "fresh"}))
+    state.put(event_factory({"event_id": "next"}))
+    _dequeue_at(state, clock, 2.001)
+    _dequeue_at(state, clock, 2.002)
+
+    assert processed == ["stale-0", "fresh", "next"]
+
+
+def test_queue_worker_codel_times_each_put_of_the_same_event(monkeypatch: pytest.MonkeyPatch, event_factory: EventFactory) -> None:
+    """Queuing one event object twice keeps a stamp per entry, so both count as stale."""
+    processed: list[str] = []
+    diagnostics: Diagnostics = []
+    state, clock = _codel_state(monkeypatch, processed, diagnostics)
+    event = event_factory({"event_id": "twice"})
+    state.put(event)
+    state.put(event)
+
+    _dequeue_at(state, clock, 1.0)
+    _dequeue_at(state, clock, 1.2)
+
+    assert processed == ["twice"]
+    assert [name for name, _ in diagnostics if name == "queue_codel_drop"] == ["queue_codel_drop"]
+
+
+def test_queue_worker_codel_stamps_blocking_puts_once_they_are_queued(monkeypatch: pytest.MonkeyPatch, event_factory: EventFactory) -> None:
+    """Time spent waiting for space under BLOCK is not counted as queue delay."""
+    clock = _Clock()
+    monkeypatch.setattr("lib_log_rich.adapters._queue_worker.time", clock)
+    state = make_state(worker=None, maxsize=4, drop_policy=QueuePolicy.BLOCK, codel_target=0.005)
+    pending = state._queue  # type: ignore[attr-defined]
+    real_put = pending.put
+
+    def slow_put(item: LogEvent | queue_worker_module._Stamped | None, *args: Any, **kwargs: Any) -> None:  # type: ignore[name-defined]
+        clock.now = 5.0
+        real_put(item, *args, **kwargs)
+
+    monkeypatch.setattr(pending, "put", slow_put)
+    assert state.put(event_factory({"event_id": "waited"})) is True
+
+    entry = pending.get_nowait()
+    assert isinstance(entry, queue_worker_module._Stamped)  # type: ignore[attr-defined]
+    assert entry.enqueued_at == 5.0
+
+
+def test_queue_worker_rejects_non_positive_codel_target() -> None:
+    """The CoDel target must be a positive delay."""
+    with pytest.raises(ValueError, match="codel_target"):
+        make_state(worker=None, codel_target=0.0)
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import re
+import sys
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
+import pytest
+
+from lib_log_rich.adapters import scrubber as scrubber_module
 from lib_log_rich.adapters.rate_limiter import SlidingWindowRateLimiter
 from lib_log_rich.adapters.scrubber import RegexScrubber
 from lib_log_rich.domain.context import LogContext
@@ -85,6 +92,13 @@ def test_scrubber_masks_sets() -> None:
     assert "***" in scrubbed.extra["token"]
 
 
+def test_scrubber_keeps_every_clean_set_member_around_a_masked_one() -> None:
+    members = {f"name-{letter}" for letter in "abcdefgh"} | {"id-42"}
+    event = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc), token=members)
+    scrubbed = make_scrubber().scrub(event)
+    assert scrubbed.extra["token"] == (members - {"id-42"}) | {"***"}
+
+
 def test_scrubber_masks_bytes_payload() -> None:
     event = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc), token=b"abc123")
     scrubbed = make_scrubber().scrub(event)
@@ -106,6 +120,16 @@ def test_scrubber_masks_tuple_payload() -> None:
     assert scrubbed.extra["token"][1] == "safe"
 
 
+def test_scrubber_masks_container_and_string_subclasses() -> None:
+    class Secret(str):
+        pass
+
+    base = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))
+    nested = base.replace(extra={"token": OrderedDict(inner=Secret("42"), count=7, flag=None)})
+    scrubbed = make_scrubber().scrub(nested)
+    assert scrubbed.extra["token"] == {"inner": "***", "count": 7, "flag": None}
+
+
 def test_scrubber_preserves_non_matching_values() -> None:
     event = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc), token=12345)
     scrubbed = make_scrubber().scrub(event)
@@ -120,6 +144,81 @@ def test_scrubber_matches_keys_case_insensitively() -> None:
     assert scrubbed.extra["TOKEN"] == "***"
 
 
+def test_scrubber_keeps_masking_remembered_keys() -> None:
+    scrubber = make_scrubber()
+    base = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))
+    first = scrubber.scrub(base.replace(extra={"Password": "hunter2", "note": "safe"}))
+    second = scrubber.scrub(base.replace(extra={"Password": "swordfish", "note": "safe"}))
+    assert first.extra == {"Password": "***", "note": "safe"}
+    assert second.extra == {"Password": "***", "note": "safe"}
+
+
+def test_scrubber_returns_clean_events_untouched() -> None:
+    base = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))
+    clean = base.replace(extra={"note": "safe", "count": 3})
+    assert make_scrubber().scrub(clean) is clean
+
+
+def test_scrubber_keeps_clean_nested_values_without_copying() -> None:
+    base = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))
+    nested = {"ids": ["abc", ("def", frozenset({"ghi"}))], "note": None}
+    clean = base.replace(extra={"token": nested})
+    scrubbed = make_scrubber().scrub(clean)
+    assert scrubbed is clean
+    assert scrubbed.extra["token"] is nested
+
+
+def test_scrubber_still_masks_keys_past_the_memo_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scrubber_module, "_KEY_CACHE_LIMIT", 1)
+    scrubber = make_scrubber()
+    base = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))
+    scrubber.scrub(base.replace(extra={"note": "safe"}))
+    scrubbed = scrubber.scrub(base.replace(extra={"note": "safe", "PASSWORD": "hunter2"}))
+    assert scrubbed.extra["PASSWORD"] == "***"
+
+
+def test_scrubber_compiles_with_the_re2_engine_when_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    compiled: list[str] = []
+
+    def fake_compile(pattern: str) -> re.Pattern[str]:
+        compiled.append(pattern)
+        return re.compile(pattern)
+
+    monkeypatch.setitem(sys.modules, "re2", SimpleNamespace(compile=fake_compile, error=re.error))
+    scrubber = RegexScrubber(patterns={"password": r".+"}, engine="re2")
+    scrubbed = scrubber.scrub(build_event(datetime(2025, 9, 23, tzinfo=timezone.utc)))
+    assert compiled == [".+"]
+    assert scrubbed.extra["password"] == "***"
+
+
+def test_scrubber_re2_engine_falls_back_to_re_for_unsupported_patterns(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Re2Error(Exception):
+        pass
+
+    def refuse_lookarounds(pattern: str) -> re.Pattern[str]:
+        if "(?=" in pattern:
+            raise Re2Error("lookaround not supported")
+        return re.compile(pattern)
+
+    monkeypatch.setitem(sys.modules, "re2", SimpleNamespace(compile=refuse_lookarounds, error=Re2Error))
+    scrubber = RegexScrubber(patterns={"password": r"(?=.*\d).+"}, engine="re2")
+    scrubbed = scrubber.scrub(build_event(datetime(2025, 9, 23, tzinfo=timezone.utc), password="hunter2"))
+    assert scrubbed.extra["password"] == "***"
+    with pytest.raises(ValueError, match="Invalid scrub pattern"):
+        RegexScrubber(patterns={"password": "("}, engine="re2")
+
+
+def test_scrubber_re2_engine_requires_the_optional_dependency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "re2", None)
+    with pytest.raises(RuntimeError, match="google-re2"):
+        RegexScrubber(patterns={"password": r".+"}, engine="re2")
+
+
+def test_scrubber_rejects_unknown_engines() -> None:
+    with pytest.raises(ValueError, match="regex engine"):
+        RegexScrubber(patterns={"password": r".+"}, engine="pcre")
+
+
 def test_scrubber_masks_context_extra() -> None:
     context = LogContext(
         service="svc",
@@ -169,3 +268,27 @@ def test_rate_limiter_resets_after_interval() -> None:
     limiter.allow(build_event(base))
     later = base + timedelta(seconds=2)
     assert limiter.allow(build_event(later)) is True
+
+
+def test_rate_limiter_frees_a_slot_exactly_one_interval_later() -> None:
+    limiter = make_limiter(max_events=2, seconds=1)
+    base = datetime(2025, 9, 23, tzinfo=timezone.utc)
+    limiter.allow(build_event(base))
+    limiter.allow(build_event(base + timedelta(milliseconds=500)))
+    assert limiter.allow(build_event(base + timedelta(milliseconds=999))) is False
+    assert limiter.allow(build_event(base + timedelta(seconds=1))) is True
+    assert limiter.allow(build_event(base + timedelta(milliseconds=1200))) is False
+
+
+def test_rate_limiter_rejects_everything_without_quota() -> None:
+    limiter = make_limiter(max_events=0, seconds=1)
+    assert limiter.allow(build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))) is False
+
+
+def test_rate_limiter_keeps_separate_quotas_per_logger_and_level() -> None:
+    limiter = make_limiter(max_events=1, seconds=1)
+    base = build_event(datetime(2025, 9, 23, tzinfo=timezone.utc))
+    assert limiter.allow(base) is True
+    assert limiter.allow(base.replace(logger_name="other")) is True
+    assert limiter.allow(base.replace(level=LogLevel.INFO)) is True
+    assert limiter.allow(base) is False
@@ -54,6 +54,8 @@ def collect_cache_stats():
                 "_resolve_template": (rich_console._resolve_template, 16),
                 "_resolve_preset": (dump._resolve_preset, 8),
                 "_resolve_theme_styles": (dump._resolve_theme_styles, 8),
+                "_normalise_style_items": (dump._normalise_style_items, 16),
+                "_style_wrapper": (dump._style_wrapper, 32),
                 "DumpFormat.from_name": (domain_dump.DumpFormat.from_name, 8),
                 "_load_console_themes": (dump._load_console_themes, None),
             },
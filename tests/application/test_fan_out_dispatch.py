@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from lib_log_rich.application.ports import ConsolePort, GraylogPort, QueuePort, StructuredBackendPort
 from lib_log_rich.application.use_cases._fan_out import build_fan_out_handlers
+from lib_log_rich.application.use_cases._pipeline import DIAGNOSTIC_DISABLED, build_diagnostic_emitter
 from lib_log_rich.application.use_cases._queue_dispatch import build_queue_dispatcher
 from lib_log_rich.domain import LogEvent, LogLevel
 from tests.os_markers import OS_AGNOSTIC
@@ -142,6 +143,71 @@ def test_fan_out_respects_dynamic_console_level(event_factory: Callable[[dict[st
     assert len(console.events) == 1
 
 
+def test_fan_out_without_backends_or_graylog_still_reaches_the_console_at_critical(
+    event_factory: Callable[[dict[str, Any] | None], LogEvent],
+) -> None:
+    console = MemoryConsole()
+    logger = logging.getLogger("tests.fan_out.console_only")
+    logger.addHandler(logging.NullHandler())
+
+    fan_out, finalize = build_fan_out_handlers(
+        console=console,
+        console_level=LogLevel.DEBUG,
+        structured_backends=[],
+        backend_level=LogLevel.DEBUG,
+        graylog=None,
+        graylog_level=LogLevel.DEBUG,
+        emit=DIAGNOSTIC_DISABLED,
+        colorize_console=False,
+        logger=logger,
+    )
+
+    event = event_factory({"level": LogLevel.CRITICAL})
+    assert fan_out(event) == []
+    assert finalize(event).ok is True
+    assert len(console.events) == 2
+
+
+class ExplodingBackend(StructuredBackendPort):
+    def emit(self, event: LogEvent) -> None:
+        raise RuntimeError("backend down")
+
+
+def test_fan_out_reports_failing_adapters_and_keeps_going(event_factory: Callable[[dict[str, Any] | None], LogEvent]) -> None:
+    console = MemoryConsole()
+    backend = MemoryBackend()
+    graylog = MemoryGraylog()
+    diagnostics: list[tuple[str, DiagnosticPayload]] = []
+    logger = logging.getLogger("tests.fan_out.failing")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    def record(name: str, payload: DiagnosticPayload) -> None:
+        diagnostics.append((name, payload))
+
+    fan_out, finalize = build_fan_out_handlers(
+        console=console,
+        console_level=LogLevel.DEBUG,
+        structured_backends=[ExplodingBackend(), backend],
+        backend_level=LogLevel.INFO,
+        graylog=graylog,
+        graylog_level=LogLevel.INFO,
+        emit=record,
+        colorize_console=False,
+        logger=logger,
+    )
+
+    event = event_factory({"level": LogLevel.ERROR})
+    assert fan_out(event) == ["ExplodingBackend"]
+    assert diagnostics[0][0] == "adapter_error"
+    assert diagnostics[0][1]["adapter"] == "ExplodingBackend"
+    assert (len(console.events), len(backend.events), len(graylog.events)) == (1, 1, 1)
+
+    result = finalize(event)
+    assert result.ok is False
+    assert result.failed_adapters == ["ExplodingBackend"]
+
+
 def test_queue_dispatch_reports_queue_full(event_factory: Callable[[dict[str, Any] | None], LogEvent]) -> None:
     queue = RejectingQueue(accept=False)
     diagnostics: list[tuple[str, DiagnosticPayload]] = []
@@ -175,3 +241,15 @@ def test_queue_dispatch_reports_success(event_factory: Callable[[dict[str, Any]
     assert result.queued is True
     assert diagnostics[0][0] == "queued"
     assert diagnostics[0][1]["event_id"] == event.event_id
+
+
+def test_queue_dispatch_succeeds_quietly_without_a_diagnostic_hook(event_factory: Callable[[dict[str, Any] | None], LogEvent]) -> None:
+    emit = build_diagnostic_emitter(None)
+    assert emit is DIAGNOSTIC_DISABLED
+
+    queue = RejectingQueue(accept=True)
+    event = event_factory(None)
+    result = build_queue_dispatcher(queue, emit)(event)
+    assert result is not None
+    assert result.ok is True
+    assert queue.events == [event]
@@ -549,6 +549,21 @@ def test_process_event_appends_process_chain_without_trimming() -> None:
     assert chain == (*base_chain, identity.resolve_identity().process_id)
 
 
+def test_process_event_fills_identity_once_then_reuses_the_bound_context() -> None:
+    """A frame already on the current PID still gains host and user once."""
+    binder = ContextBinder()
+    identity = StaticIdentity(user_name="svc", hostname="updated", process_id=3003)
+    process, ring, _ = build_process(binder=binder, identity=identity)
+
+    with binder.bind(service="svc", environment="test", job_id="job-steady", process_id=3003, process_id_chain=(3003,)):
+        process(logger_name="tests.steady", level=LogLevel.INFO, message="first")
+        process(logger_name="tests.steady", level=LogLevel.INFO, message="second")
+
+    first, second = (event.context for event in ring.snapshot())
+    assert (first.hostname, first.user_name) == ("updated", "svc")
+    assert second is first
+
+
 def test_process_event_diagnostic_callback_errors_are_swallowed() -> None:
     """Diagnostic callbacks raising errors do not break the pipeline."""
     binder = ContextBinder()
@@ -251,3 +251,20 @@ def test_context_binder_propagates_to_child_process_preserves_request_id() -> No
         serialized = binder.serialize()
     child_data = collect_child_payload(serialized)
     assert child_data["request_id"] == "req-99"
+
+
+def test_merge_keeps_parent_values_for_none_overrides_and_copies_extra() -> None:
+    parent = make_context(request_id="req-1", process_id_chain=(1, 2), extra={"shared": "yes"})
+    child = parent.merge(request_id=None, user_id="user-9", extra={"child": "only"})
+
+    assert (child.request_id, child.user_id) == ("req-1", "user-9")
+    assert child.process_id_chain == (1, 2)
+    assert child.extra == {"child": "only"}
+    plain = parent.merge(trace_id="t-1")
+    plain.extra["leak"] = True
+    assert parent.extra == {"shared": "yes"}
+
+
+def test_merge_still_validates_identifiers() -> None:
+    with pytest.raises(ValueError, match="service"):
+        make_context().merge(service="  ")
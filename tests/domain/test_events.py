@@ -93,3 +93,22 @@ def test_log_event_dict_includes_exc_info(bound_context: LogContext) -> None:
 def test_log_event_dict_includes_stack_info(bound_context: LogContext) -> None:
     event = build_event(context=bound_context, stack_info="stack")
     assert event.to_dict()["stack_info"] == "stack"
+
+
+def test_log_event_with_payload_matches_replace(bound_context: LogContext) -> None:
+    """`with_payload` yields the same event `replace` would build."""
+    event = build_event(context=bound_context, extra={"token": "secret"}, exc_info="trace", stack_info="stack")
+    other_context = bound_context.replace(job_id="other")
+    fast = event.with_payload(extra={"token": "***"}, context=other_context)
+    assert fast == event.replace(extra={"token": "***"}, context=other_context)
+    assert event.extra == {"token": "secret"}
+
+
+def test_log_event_formats_its_iso_timestamp_once_and_shares_it_with_payload_copies(bound_context: LogContext) -> None:
+    """`timestamp_iso` is cached per event and follows the timestamp."""
+    event = build_event(context=bound_context)
+    iso = event.timestamp_iso
+    assert iso == event.timestamp.isoformat()
+    assert event.with_payload(extra={}, context=bound_context).timestamp_iso is iso
+    later = datetime(2025, 9, 24, 11, 0, 0, tzinfo=timezone.utc)
+    assert event.replace(timestamp=later).timestamp_iso == later.isoformat()
@@ -4,7 +4,7 @@ import logging
 
 import pytest
 
-from lib_log_rich.domain.levels import LogLevel
+from lib_log_rich.domain.levels import LEVEL_NAMES, LogLevel
 from tests.os_markers import OS_AGNOSTIC
 
 pytestmark = [OS_AGNOSTIC]
@@ -108,3 +108,8 @@ def test_level_code_matches_table(level: LogLevel, code: str) -> None:
 )
 def test_level_severity_matches_lowercase_name(level: LogLevel, severity: str) -> None:
     assert level.severity == severity
+
+
+@pytest.mark.parametrize("level", list(LogLevel))
+def test_level_names_table_matches_member_names(level: LogLevel) -> None:
+    assert LEVEL_NAMES[level] == level.name
@@ -62,3 +62,16 @@ def test_severity_monitor_uses_default_threshold_when_provided_empty_iterable()
     monitor = SeverityMonitor(thresholds=[])
     monitor.record(LogLevel.ERROR)
     assert monitor.threshold_counts()[LogLevel.ERROR] == 1
+
+
+def test_severity_monitor_remembers_reasons_across_reset() -> None:
+    monitor = SeverityMonitor(drop_reasons=["Queue_Full"])
+    monitor.record_drop(LogLevel.INFO, "rate_limited")
+    monitor.record_drop(LogLevel.ERROR, "adapter_error")
+
+    monitor.reset()
+
+    assert monitor.drops_by_reason() == {"queue_full": 0, "rate_limited": 0, "adapter_error": 0}
+    monitor.record_drop(LogLevel.INFO, "rate_limited")
+    assert monitor.drops_by_reason() == {"queue_full": 0, "rate_limited": 1, "adapter_error": 0}
+    assert monitor.drops_by_level()[LogLevel.INFO] == 1
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from lib_log_rich.runtime import _factories as factories_module
 from lib_log_rich.runtime._factories import (
     FeatureFlags,
     SystemIdentityProvider,
@@ -25,6 +26,19 @@ def test_system_identity_provider_uses_environment_when_getuser_missing(monkeypa
     assert identity.user_name == "env-user"
 
 
+def test_system_identity_provider_reports_the_child_pid_after_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    clear_identity_cache()
+    provider = SystemIdentityProvider()
+    parent = provider.resolve_identity()
+    monkeypatch.setattr(factories_module.os, "getpid", lambda: parent.process_id + 1)
+    assert provider.resolve_identity().process_id == parent.process_id
+    factories_module._forget_process_id()  # type: ignore[attr-defined]  # what the after-fork hook runs
+    child = provider.resolve_identity()
+    assert child.process_id == parent.process_id + 1
+    assert (child.user_name, child.hostname) == (parent.user_name, parent.hostname)
+    clear_identity_cache()
+
+
 def test_create_structured_backends_returns_optional_adapters(monkeypatch: pytest.MonkeyPatch) -> None:
     adapters: dict[str, Any] = {"journald": object(), "eventlog": object()}
 